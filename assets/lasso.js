@@ -0,0 +1,62 @@
+// Clientside rendering for make_lasso_component(..., clientside=True).
+// Mirrors _equation_children/_update in components/lasso_component.py.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    lasso: {
+        renderEquation: function (alphaIdx, data) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (alphaIdx === null || alphaIdx === undefined || !data) {
+                return [noUpdate, noUpdate];
+            }
+            const html = (type, children, style) => ({
+                type: type,
+                namespace: "dash_html_components",
+                props: style ? { children: children, style: style } : { children: children },
+            });
+            const styles = data.styles;
+            const truth = new Set(data.truth);
+            const support = data.support[alphaIdx];
+            const wrapEvery = 8;
+
+            const term = (j1) =>
+                html(
+                    "Span",
+                    [
+                        html("Span", "β", { fontStyle: "italic" }),
+                        html("Sub", String(j1)),
+                        html("Span", "("),
+                        html("Span", "x", { fontStyle: "italic" }),
+                        html("Sub", String(j1)),
+                        html("Span", ")"),
+                    ],
+                    truth.has(j1) ? styles.termRed : styles.termBold
+                );
+
+            const parts = [
+                html("Span", "ŷ = ", { fontWeight: 700 }),
+                html("Span", "β", { fontStyle: "italic", fontWeight: 700 }),
+                html("Sub", "0"),
+            ];
+            if (support.length) {
+                parts.push(html("Span", "+", styles.plus));
+                support.forEach((j1, i) => {
+                    const count = i + 1;
+                    parts.push(term(j1));
+                    if (count < support.length) {
+                        parts.push(
+                            count % wrapEvery === 0
+                                ? html("Br", null)
+                                : html("Span", "+", styles.plus)
+                        );
+                    }
+                });
+            } else {
+                parts.push(html("Span", " (no predictors selected)", { color: "#665" }));
+            }
+
+            const metrics =
+                `α = ${data.labels[alphaIdx]} | selected predictors = ${support.length}` +
+                ` | Test R² = ${data.r2s[alphaIdx].toFixed(3)}`;
+            return [parts, metrics];
+        },
+    },
+});
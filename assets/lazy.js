@@ -0,0 +1,21 @@
+// Clientside helpers for components/lazy.py.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    lazy: {
+        // Flag a lazy slot as visible once it is within one viewport of the screen.
+        whenVisible: function (nIntervals, slotId) {
+            const noUpdate = window.dash_clientside.no_update;
+            const el = document.getElementById(
+                JSON.stringify({ type: slotId.type, uid: slotId.uid })
+            );
+            if (!el) {
+                return [noUpdate, noUpdate];
+            }
+            const rect = el.getBoundingClientRect();
+            const margin = window.innerHeight;
+            if (rect.top < window.innerHeight + margin && rect.bottom > -margin) {
+                return [true, true];
+            }
+            return [noUpdate, noUpdate];
+        },
+    },
+});
@@ -0,0 +1,345 @@
+"""Benchmark component build time, callback latency and payload size.
+
+Callbacks are invoked directly (no browser or HTTP server), so this runs
+offline on any machine with the project dependencies installed. Results are
+written as JSON for comparison between commits.
+
+Usage:
+    python benchmark.py --out benchmark_results.json
+    python benchmark.py --quick          # smaller sweeps, fewer repeats
+    python benchmark.py --check          # path engine vs sklearn lasso_path only
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import dash
+import numpy as np
+from plotly.io.json import to_json_plotly
+
+from components import artifact_cache, coef_paths, cv, econ_demo, full_rank_component
+from components import monte_carlo
+from components import interactive2, lasso_component
+from components.datasets import sparse_regression
+from components.path_engine import screened_lasso_path
+
+
+def _payload_bytes(value) -> int:
+    return len(to_json_plotly(value).encode("utf-8"))
+
+
+def _time(fn: Callable[[], object], repeat: int, setup: Callable[[], None] = None):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    summary = {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "repeat": repeat,
+    }
+    return summary, result
+
+
+class Recorder:
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: List[Dict[str, object]] = []
+
+    def record(self, kind, name, params, fn, *, setup=None, repeat=None):
+        seconds, result = _time(fn, repeat or self.repeat, setup)
+        entry = {
+            "kind": kind,
+            "name": name,
+            "params": params,
+            "seconds": seconds,
+            "payload_bytes": _payload_bytes(result),
+        }
+        self.results.append(entry)
+        print(
+            f"{kind:8s} {name:28s} {json.dumps(params):48s} "
+            f"median={seconds['median'] * 1e3:9.2f} ms  "
+            f"payload={entry['payload_bytes'] / 1024:9.1f} KiB"
+        )
+        return result
+
+
+def _clear_lasso_caches():
+    lasso_component._fit_lasso_grid.cache_clear()
+    lasso_component._equation_payload.cache_clear()
+    lasso_component._fit_lasso_cv.cache_clear()
+
+
+def bench_builds(rec: Recorder, quick: bool) -> None:
+    app = dash.Dash(__name__)
+    lasso_shapes = [(50, 150)] if quick else [(50, 150), (100, 500), (200, 2000)]
+    path_shapes = [(40, 120)] if quick else [(40, 120), (100, 500), (200, 2000)]
+
+    max_bytes = artifact_cache.MAX_BYTES
+    for cold in (True, False):
+        # Cold builds bypass the on-disk artifact cache; warm builds hit it.
+        artifact_cache.MAX_BYTES = 0 if cold else max_bytes
+        label = "cold" if cold else "warm"
+        for n, p in lasso_shapes:
+            rec.record(
+                "build",
+                f"lasso_component[{label}]",
+                {"n": n, "p": p},
+                lambda: lasso_component.make_lasso_component(app, uid="bench", n=n, p=p),
+                setup=_clear_lasso_caches,
+            )
+        for n, p in path_shapes:
+            for render in ("svg", "webgl"):
+                rec.record(
+                    "build",
+                    f"lasso_path_component[{label}]",
+                    {"n": n, "p": p, "render": render},
+                    lambda: coef_paths.make_lasso_path_component(
+                        app, uid="bench", n=n, p=p, render=render
+                    ),
+                )
+    artifact_cache.MAX_BYTES = max_bytes
+
+    rec.record(
+        "build",
+        "full_rank_component",
+        {},
+        lambda: full_rank_component.make_full_rank_component(app, uid="bench"),
+    )
+    rec.record(
+        "build",
+        "econ_component",
+        {},
+        lambda: econ_demo.make_econ_component(app, uid="bench"),
+    )
+    for n, p in [(100, 10)] if quick else [(100, 10), (500, 50)]:
+        rec.record(
+            "build",
+            "path_comparison",
+            {"n": n, "p": p},
+            lambda: interactive2.make_path_comparison(n=n, p=p),
+        )
+
+
+def bench_callbacks(rec: Recorder, quick: bool) -> None:
+    # LASSO _update: first call per alpha is a miss, repeats are cache hits.
+    alphas = list(lasso_component.ALPHAS)
+    for n, p in [(50, 150)] if quick else [(50, 150), (100, 500)]:
+        params = {"n": n, "p": p}
+        for alpha_idx in range(len(alphas)):
+            rec.record(
+                "callback",
+                "lasso._update[miss]",
+                {"n": n, "p": p, "alpha_idx": alpha_idx},
+                lambda: lasso_component._update(alpha_idx, params),
+                setup=lasso_component._equation_payload.cache_clear,
+            )
+            rec.record(
+                "callback",
+                "lasso._update[hit]",
+                {"n": n, "p": p, "alpha_idx": alpha_idx},
+                lambda: lasso_component._update(alpha_idx, params),
+            )
+
+    # LASSO refits from the n / p / SNR sliders; cold fits bypass the artifact cache.
+    max_bytes = artifact_cache.MAX_BYTES
+    artifact_cache.MAX_BYTES = 0
+    base = {"n": 50, "p": 150, "snr": 5.0}
+    refits = (
+        [(50, 150, 5.0), (200, 1000, 5.0)]
+        if quick
+        else [(50, 150, 5.0), (200, 1000, 5.0), (500, 3000, 5.0), (500, 3000, 2.0)]
+    )
+    for n, p, snr in refits:
+        for label, setup in (("miss", _clear_lasso_caches), ("hit", None)):
+            rec.record(
+                "callback",
+                f"lasso._refit_clientside[{label}]",
+                {"n": n, "p": p, "snr": snr},
+                lambda: lasso_component._refit_clientside(n, p, snr, base),
+                setup=setup,
+            )
+    artifact_cache.MAX_BYTES = max_bytes
+
+    # K-fold CV engine alone, in-process versus one worker per fold. The first
+    # parallel run also pays for starting the pool.
+    cv_shapes = [(200, 1000)] if quick else [(200, 1000), (500, 3000)]
+    cv_alphas = lasso_component._cv_alphas(lasso_component.ALPHAS)
+    for n, p in cv_shapes:
+        data = sparse_regression(n, p, seed=0, support=lasso_component._TRUE_SUPPORT)
+        for n_jobs in sorted({1, cv.default_jobs(lasso_component._CV_FOLDS)}):
+            rec.record(
+                "engine",
+                "cv.kfold_lasso_cv",
+                {"n": n, "p": p, "alphas": len(cv_alphas), "n_jobs": n_jobs},
+                lambda: cv.kfold_lasso_cv(
+                    data.X, data.y, cv_alphas, k=lasso_component._CV_FOLDS, n_jobs=n_jobs
+                ).fold_mse,
+            )
+
+    # OLS vs LASSO Monte Carlo sweep, uncached; the p grid straddles p = n.
+    artifact_cache.MAX_BYTES = 0
+    for n, n_seeds in [(50, 20)] if quick else [(50, 20), (100, 50)]:
+        p_grid = monte_carlo.default_p_grid(n)
+        for n_jobs in sorted({1, cv.default_jobs(len(p_grid))}):
+            rec.record(
+                "engine",
+                "monte_carlo.sweep_test_error",
+                {"n": n, "p_values": len(p_grid), "n_seeds": n_seeds, "n_jobs": n_jobs},
+                lambda: monte_carlo.sweep_test_error(
+                    n, p_grid, n_seeds=n_seeds, n_jobs=n_jobs
+                ).ols_mse,
+                repeat=1 if quick else 3,
+            )
+    artifact_cache.MAX_BYTES = max_bytes
+
+    # Full-rank _render across shapes and seeds.
+    shapes = [(100, 5), (6, 10)] if quick else [(100, 5), (40, 8), (10, 10), (6, 10), (2000, 400)]
+    seeds = [0] if quick else [0, 1, 2]
+    for n, p in shapes:
+        for seed in seeds:
+            rec.record(
+                "callback",
+                "full_rank._render[miss]",
+                {"n": n, "p": p, "seed": seed},
+                lambda: full_rank_component._render(n, p, {"seed": seed}),
+                setup=full_rank_component._render_outputs.cache_clear,
+            )
+            rec.record(
+                "callback",
+                "full_rank._render[hit]",
+                {"n": n, "p": p, "seed": seed},
+                lambda: full_rank_component._render(n, p, {"seed": seed}),
+            )
+
+    # Econometrics sliders: OLS fits plus B bootstrap refits in one stacked solve.
+    econ = (
+        [(50, 2000), (500, 2000)]
+        if quick
+        else [(50, 2000), (200, 2000), (500, 2000), (500, 5000)]
+    )
+    for n, n_boot in econ:
+        for label, setup in (("miss", econ_demo._econ_outputs.cache_clear), ("hit", None)):
+            rec.record(
+                "callback",
+                f"econ._update[{label}]",
+                {"n": n, "n_boot": n_boot},
+                lambda: econ_demo._update(n, 1.0, 0, n_boot, {"figure_digits": 4}),
+                setup=setup,
+            )
+
+    for preset in full_rank_component._PRESETS:
+        rec.record(
+            "callback",
+            "full_rank._apply_preset",
+            {"preset": preset},
+            lambda: full_rank_component._apply_preset(preset),
+        )
+    rec.record(
+        "callback",
+        "full_rank._update_seed",
+        {"n_clicks": 1},
+        lambda: full_rank_component._update_seed(1, {"seed": 0}),
+    )
+
+
+def check_path_engine(
+    shapes=((100, 50), (50, 150), (200, 1000), (500, 3000)), rtol: float = 1e-6
+) -> bool:
+    """Compare ``screened_lasso_path`` with sklearn's ``lasso_path``; True if all agree.
+
+    The grid runs from above alpha_max (all zeros) down to alpha_max / 100 and
+    is passed in ascending order, so the engine also has to restore the order.
+    Both solvers must reach the same LASSO objective to ``rtol``.
+    """
+
+    from sklearn.linear_model import lasso_path
+
+    ok = True
+    for n, p in shapes:
+        data = sparse_regression(n, p, seed=0, support=tuple(range(6)))
+        X = (data.X - data.X.mean(axis=0)) / data.X.std(axis=0)
+        y = data.y - data.y.mean()
+        alpha_max = np.abs(X.T @ y).max() / n
+        alphas = alpha_max * np.geomspace(2.0, 1e-2, 13)
+
+        ours = screened_lasso_path(X, y, alphas[::-1], tol=1e-7, max_iter=20000)[::-1]
+        _, ref, _ = lasso_path(X, y, alphas=alphas, tol=1e-7, max_iter=20000)
+        ref = ref.T
+
+        def objective(coefs):
+            resid = y[None, :] - coefs @ X.T
+            return (resid**2).sum(axis=1) / (2 * n) + alphas * np.abs(coefs).sum(axis=1)
+
+        gap = np.max(np.abs(objective(ours) - objective(ref)) / objective(ref))
+        agree = gap <= rtol
+        ok &= bool(agree)
+        print(
+            f"{'ok' if agree else 'FAIL':4s} path_engine vs lasso_path n={n:<4d} p={p:<5d} "
+            f"objective rel. diff={gap:.1e}  max |coef diff|={np.abs(ours - ref).max():.1e}"
+        )
+
+    try:
+        screened_lasso_path(X, y, [0.0, 0.1])
+    except ValueError:
+        print("ok   path_engine rejects alpha = 0")
+    else:
+        print("FAIL path_engine accepted alpha = 0")
+        ok = False
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--repeat", type=int, default=None, help="default: 5 (2 with --quick)")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check the LASSO path engine against sklearn; exit 1 on mismatch",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check_path_engine() else 1)
+
+    rec = Recorder(repeat=args.repeat or (2 if args.quick else 5))
+    bench_builds(rec, args.quick)
+    bench_callbacks(rec, args.quick)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "packages": {
+                name: version(name)
+                for name in ("dash", "numpy", "scikit-learn", "plotly")
+            },
+            "quick": args.quick,
+        },
+        "results": rec.results,
+    }
+    args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Wrote {len(rec.results)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,25 @@
 """Reusable Dash components for the high-dimensional regression app."""
 
 __all__ = [
+    "artifact_cache",
+    "background",
+    "cv",
+    "datasets",
+    "double_descent",
+    "figures",
+    "hot_reload",
+    "http_cache",
+    "instrumentation",
     "interactive1",
     "interactive2",
     "lasso_component",
+    "lazy",
+    "linalg",
+    "monte_carlo",
+    "ols",
     "full_rank_component",
+    "path_engine",
+    "regularization_paths",
     "table_of_contents",
     "utils",
 ]
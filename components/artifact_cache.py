@@ -0,0 +1,120 @@
+"""Content-addressed on-disk cache for precomputed numpy arrays.
+
+Each entry is a directory of ``.npy`` files named after a hash of the producing
+component, its parameters and the numpy/scikit-learn versions. Hits are read
+with ``mmap_mode="r"`` so every worker process shares the same pages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional
+
+import numpy as np
+
+CACHE_DIR = Path(os.environ.get("HIGHDIM_CACHE_DIR", ".cache/artifacts"))
+# Total bytes kept on disk; 0 disables the cache entirely.
+MAX_BYTES = int(os.environ.get("HIGHDIM_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "missing"
+
+
+def _jsonable(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return np.asarray(value).tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot hash parameter of type {type(value).__name__}")
+
+
+def artifact_key(namespace: str, params: Mapping[str, object]) -> str:
+    """Return the content hash identifying ``params`` for ``namespace``."""
+
+    payload = json.dumps(
+        {
+            "namespace": namespace,
+            "params": params,
+            "numpy": np.__version__,
+            "sklearn": _package_version("scikit-learn"),
+        },
+        sort_keys=True,
+        default=_jsonable,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(f.stat().st_size for f in entry.glob("*.npy"))
+
+
+def _load(entry: Path) -> Optional[Dict[str, np.ndarray]]:
+    if not entry.is_dir():
+        return None
+    try:
+        arrays = {f.stem: np.load(f, mmap_mode="r") for f in entry.glob("*.npy")}
+        os.utime(entry)  # Mark as recently used for eviction.
+    except (OSError, ValueError):
+        return None
+    return arrays or None
+
+
+def _store(entry: Path, arrays: Mapping[str, np.ndarray]) -> None:
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+    try:
+        for name, arr in arrays.items():
+            np.save(tmp / f"{name}.npy", np.ascontiguousarray(arr))
+        os.replace(tmp, entry)
+    except OSError:
+        # Another worker won the race (or the disk is read-only); keep theirs.
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def evict(max_bytes: int = MAX_BYTES, cache_dir: Path = CACHE_DIR) -> None:
+    """Drop least recently used entries until the cache fits in ``max_bytes``."""
+
+    if not cache_dir.is_dir():
+        return
+    entries = [e for e in cache_dir.iterdir() if e.is_dir() and not e.name.startswith(".")]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    total = sum(_entry_size(e) for e in entries)
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        total -= _entry_size(entry)
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def cached_arrays(
+    namespace: str,
+    params: Mapping[str, object],
+    compute: Callable[[], Mapping[str, np.ndarray]],
+) -> Dict[str, np.ndarray]:
+    """Return the arrays for ``params``, computing and storing them on a miss.
+
+    Arrays loaded from disk are read-only memory maps.
+    """
+
+    if MAX_BYTES <= 0:
+        return dict(compute())
+
+    entry = CACHE_DIR / f"{namespace}-{artifact_key(namespace, params)}"
+    arrays = _load(entry)
+    if arrays is not None:
+        return arrays
+
+    computed = dict(compute())
+    _store(entry, computed)
+    evict()
+    return _load(entry) or computed
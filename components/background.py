@@ -0,0 +1,113 @@
+"""Optional Dash background-callback manager for the expensive callbacks.
+
+With ``diskcache`` installed (``pip install "dash[diskcache]"``), heavy callbacks
+run in a separate process instead of the Flask request thread, and Dash
+terminates the previous job when the same callback fires again (e.g. the user
+moves a slider before the last solve finished). Without it, or with
+``HIGHDIM_BACKGROUND=0``, every callback runs synchronously as before.
+
+Dash starts a new job process on every call, even for inputs it has already
+answered, so ``shared_memoize`` keeps results in a diskcache that the server
+and its jobs share. A repeated design is then read back, not solved again. The
+cache is opened, and diskcache imported, on the first call.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import os
+import threading
+import uuid
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+CACHE_DIR = Path(os.environ.get("HIGHDIM_CALLBACK_CACHE_DIR", ".cache/callbacks"))
+# Background results are memoized per launch: a restart may ship new code.
+_LAUNCH_UID = uuid.uuid4().hex
+# Key under which a shared memo cache records the launch its counters belong to.
+_STATS_LAUNCH_KEY = "__launch__"
+# Milliseconds between the browser's polls for a background result (Dash
+# defaults to 1000, which would add up to a second to every update).
+POLL_INTERVAL = 200
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+def make_background_manager(cache_dir: Path = CACHE_DIR, *, expire: int = 3600):
+    """Return a ``DiskcacheManager``, or ``None`` when it is unavailable or disabled."""
+
+    if os.environ.get("HIGHDIM_BACKGROUND", "1") != "1":
+        return None
+    try:
+        import diskcache
+        from dash import DiskcacheManager
+    except ImportError:
+        return None
+    return DiskcacheManager(
+        diskcache.Cache(str(cache_dir)),
+        cache_by=[lambda: _LAUNCH_UID],
+        expire=expire,
+    )
+
+
+def background_options(app, *, running: Optional[list] = None) -> Dict[str, object]:
+    """Keyword arguments that make ``app.callback`` run in the background if it can."""
+
+    if getattr(app, "_background_manager", None) is None:
+        return {}
+    options: Dict[str, object] = {"background": True, "interval": POLL_INTERVAL}
+    if running:
+        options["running"] = running
+    return options
+
+
+def shared_memoize(namespace: str, *, expire: int = 3600, maxsize: int = 32):
+    """Memoize a function in a diskcache shared by every process of this launch.
+
+    Entries live in ``CACHE_DIR/memo/<namespace>`` and expire ``expire``
+    seconds after they were written. Hits and misses are counted there too, so
+    ``wrapped.cache_info()`` includes lookups made inside background jobs.
+    Without diskcache this falls back to a per-process ``lru_cache(maxsize)``.
+    """
+
+    def decorate(fn: Callable) -> Callable:
+        if importlib.util.find_spec("diskcache") is None:
+            return functools.lru_cache(maxsize=maxsize)(fn)
+
+        # The cache is opened on the first call, so importing a module that
+        # declares a memoized function does not import diskcache.
+        state = {}
+        lock = threading.Lock()
+
+        def _memoized():
+            with lock:
+                if not state:
+                    import diskcache
+
+                    cache = diskcache.Cache(str(CACHE_DIR / "memo" / namespace))
+                    # Counters start at zero once per launch, in whichever
+                    # process (server or job) opens the cache first.
+                    with cache.transact():
+                        first = cache.pop(_STATS_LAUNCH_KEY, None) != _LAUNCH_UID
+                        cache.set(_STATS_LAUNCH_KEY, _LAUNCH_UID)
+                        cache.stats(enable=True, reset=first)
+                    # The launch id keeps results of older code from being served.
+                    state["cache"] = cache
+                    state["fn"] = cache.memoize(name=f"{namespace}-{_LAUNCH_UID}", expire=expire)(fn)
+                return state["cache"], state["fn"]
+
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs):
+            return _memoized()[1](*args, **kwargs)
+
+        def cache_info() -> CacheInfo:
+            cache = _memoized()[0]
+            hits, misses = cache.stats()
+            return CacheInfo(hits, misses, None, len(cache) - 1)  # minus the launch marker
+
+        wrapped.cache_info = cache_info
+        return wrapped
+
+    return decorate
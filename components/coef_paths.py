@@ -1,17 +1,289 @@
 # lasso_path_component.py
+import json
+import threading
+
 import numpy as np
-from sklearn.linear_model import lasso_path
-from dash import html, dcc
+from dash import MATCH, Input, Output, State, html, dcc
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
 
+from components.artifact_cache import cached_arrays
+from components.datasets import sparse_regression
+from components.figures import compact_figure
+from components.utils import register_once
+
 # Optional style tokens (tweak or remove as you like)
 STYLES = {
     "wrap": {"maxWidth": "1000px", "margin": "0 auto", "fontFamily": "system-ui, Arial, sans-serif"},
     "title": {"margin": "0.5rem 0 0.25rem 0", "fontSize": "20px", "fontWeight": 700},
     "subtitle": {"color": "#555", "marginBottom": "0.75rem", "fontSize": "14px"},
     "meta": {"fontSize": "14px", "color": "#555", "marginTop": "8px"},
+    "status": {"fontSize": "13px", "color": "#6b7280", "fontStyle": "italic", "minHeight": "1.2em"},
 }
 
+# Progressive mode: the figure spec and background solve of every component
+# built in this process, by uid. Callbacks only look entries up, so the number
+# of jobs is bounded by the components the server builds, not by its clients.
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+
+# WebGL defaults. The batched "other β" trace repeats the alpha grid for every
+# coefficient, so its size grows with p × n_alphas; at p=120 float32 rounding
+# halves the figure (149 → 78 KiB) and capping the plotted alphas bounds it
+# for dense alpha grids.
+_WEBGL_FIGURE_DIGITS = 4
+_WEBGL_MAX_ALPHAS = 50
+
+
+def _support_indices(p):
+    # last index is p-1 to keep general for any p >= 120
+    return [19, 39, 59, 79, 99, min(119, p - 1)]
+
+
+def _simulate(n, p, seed, target_signal_noise_ratio):
+    data = sparse_regression(
+        n,
+        p,
+        seed=seed,
+        support=tuple(_support_indices(p)),
+        snr=float(target_signal_noise_ratio),
+    )
+    return data.X, data.y
+
+
+def _cache_params(n, p, seed, target_signal_noise_ratio, alphas):
+    return {
+        "n": n,
+        "p": p,
+        "seed": seed,
+        "target_signal_noise_ratio": target_signal_noise_ratio,
+        "alphas": np.asarray(alphas, dtype=float),
+    }
+
+
+class _PathJob:
+    """Solve a LASSO path one alpha at a time on a daemon thread.
+
+    Alphas are visited from largest to smallest and each solve is warm-started
+    from the previous coefficients, which is exactly what ``lasso_path`` does
+    internally, so the finished path matches the blocking mode and is stored
+    under the same artifact cache key.
+    """
+
+    def __init__(self, n, p, seed, target_signal_noise_ratio, alphas):
+        self.params = _cache_params(n, p, seed, target_signal_noise_ratio, alphas)
+        self.alphas = np.sort(self.params["alphas"])[::-1]
+        self.error = None
+        self._lock = threading.Lock()
+        self._coefs = []
+        self._done = False
+        self._thread = threading.Thread(target=self._run, name="lasso-path-job", daemon=True)
+        self._thread.start()
+
+    def _solve(self):
+        from sklearn.linear_model import lasso_path
+
+        params = self.params
+        X, y = _simulate(
+            params["n"], params["p"], params["seed"], params["target_signal_noise_ratio"]
+        )
+        coef = None
+        for alpha in self.alphas:
+            # coef_init is updated in place by the solver, so hand it a copy.
+            init = None if coef is None else coef.copy()
+            _, step, _ = lasso_path(X, y, alphas=[alpha], coef_init=init)
+            coef = step[:, 0]
+            with self._lock:
+                self._coefs.append(coef)
+        return {"alphas": self.alphas, "coefs": np.column_stack(self._coefs)}
+
+    def _run(self):
+        try:
+            path = cached_arrays("lasso-path", self.params, self._solve)
+            with self._lock:
+                self._coefs = list(np.asarray(path["coefs"]).T)
+        except Exception as err:  # surfaced in the status line instead of killing the thread
+            self.error = f"{type(err).__name__}: {err}"
+        finally:
+            with self._lock:
+                self._done = True
+
+    def snapshot(self):
+        """Return ``(alphas, coefs, done)`` for the alphas solved so far."""
+        with self._lock:
+            k = len(self._coefs)
+            coefs = np.column_stack(self._coefs) if k else np.empty((self.params["p"], 0))
+            return self.alphas[:k], coefs, self._done
+
+
+def _path_job(uid, spec):
+    """Return the job for component ``uid``, starting one if its spec is new."""
+    key = json.dumps(
+        [spec[k] for k in ("n", "p", "seed", "target_signal_noise_ratio", "alphas")]
+    )
+    with _JOBS_LOCK:
+        entry = _JOBS.get(uid)
+        if entry is None or entry[0] != key:
+            job = _PathJob(
+                spec["n"],
+                spec["p"],
+                spec["seed"],
+                spec["target_signal_noise_ratio"],
+                spec["alphas"],
+            )
+            entry = _JOBS[uid] = (key, spec, job)
+        return entry[2]
+
+
+def wait_for_path_jobs(timeout=None):
+    """Block until every running path job has finished.
+
+    Call before forking worker processes: threads do not survive ``fork``, so a
+    job still running in the parent would never finish in the children.
+    """
+    with _JOBS_LOCK:
+        jobs = [job for _, _, job in _JOBS.values()]
+    for job in jobs:
+        job._thread.join(timeout)
+
+
+def _subsample(alphas, coefs, n_total, max_alphas):
+    # Indices are chosen on the full grid so a partial path shows the same points.
+    if max_alphas is None or n_total <= max_alphas:
+        return alphas, coefs
+    keep = np.unique(np.linspace(0, n_total - 1, max_alphas).round().astype(int))
+    keep = keep[keep < len(alphas)]
+    return alphas[keep], coefs[:, keep]
+
+
+def _path_traces(alphas, coefs, highlighted):
+    # One SVG trace (with its own hovertemplate) per coefficient.
+    traces = []
+    for j, coef_path in enumerate(coefs):
+        is_true = j in highlighted
+        traces.append(
+            go.Scatter(
+                x=alphas,
+                y=coef_path,
+                mode="lines",
+                name=f"β[{j}]",
+                # Use f-string and escape braces so Plotly gets %{x}/%{y} placeholders
+                hovertemplate=f"alpha=%{{x:.4f}}<br>coef=%{{y:.4f}}<extra>β[{j}]</extra>",
+                line=dict(width=2 if is_true else 1, dash="solid"),
+                opacity=1.0 if is_true else 0.5,
+                showlegend=False,
+            )
+        )
+    return traces
+
+
+def _batched_path_traces(alphas, coefs, highlighted):
+    # WebGL traces: every non-highlighted path shares one NaN-separated line,
+    # so the figure has len(highlighted) + 1 traces regardless of p.
+    others = [j for j in range(coefs.shape[0]) if j not in highlighted]
+    n_alphas = len(alphas)
+    x = np.full((len(others), n_alphas + 1), np.nan)
+    x[:, :n_alphas] = alphas
+    y = np.full((len(others), n_alphas + 1), np.nan)
+    y[:, :n_alphas] = coefs[others]
+
+    traces = [
+        go.Scattergl(
+            x=x.ravel(),
+            y=y.ravel(),
+            mode="lines",
+            name="other β",
+            hovertemplate="alpha=%{x:.4f}<br>coef=%{y:.4f}<extra>other β</extra>",
+            line=dict(width=1, color="#9aa5b1"),
+            opacity=0.5,
+            connectgaps=False,
+            showlegend=False,
+        )
+    ]
+    for j in sorted(highlighted):
+        traces.append(
+            go.Scattergl(
+                x=alphas,
+                y=coefs[j],
+                mode="lines",
+                name=f"β[{j}]",
+                hovertemplate=f"alpha=%{{x:.4f}}<br>coef=%{{y:.4f}}<extra>β[{j}]</extra>",
+                line=dict(width=2),
+                showlegend=False,
+            )
+        )
+    return traces
+
+
+def _path_figure(alphas, coefs, highlighted, *, render="svg", digits=None):
+    if render == "webgl":
+        traces = _batched_path_traces(alphas, coefs, highlighted)
+    elif render == "svg":
+        traces = _path_traces(alphas, coefs, highlighted)
+    else:
+        raise ValueError(f"render must be 'svg' or 'webgl', got {render!r}")
+
+    layout = go.Layout(
+        title="LASSO Coefficient Paths (Synthetic)",
+        xaxis=dict(title="Lambda (Regularization Strength)", type="log"),
+        yaxis=dict(title="Coefficient Value"),
+        hovermode="closest",
+        margin=dict(l=60, r=20, t=60, b=60),
+        plot_bgcolor="#fff",
+        paper_bgcolor="#fff",
+        height=650,
+        font=dict(family=STYLES["wrap"]["fontFamily"], size=14),
+    )
+    fig = go.Figure(data=traces, layout=layout)
+    return fig if digits is None else compact_figure(fig, digits)
+
+
+def _status_text(job, solved, done):
+    if job.error is not None:
+        return f"Path computation failed: {job.error}"
+    if done:
+        return ""
+    return f"Solving the path: {solved} of {len(job.alphas)} alphas so far…"
+
+
+def _poll_path(_, poll_id, shown):
+    uid = poll_id.get("uid") if isinstance(poll_id, dict) else None
+    with _JOBS_LOCK:
+        entry = _JOBS.get(uid) if isinstance(uid, str) else None
+    if entry is None:
+        # Not built in this process; another worker answers a later poll.
+        raise PreventUpdate
+    _, spec, job = entry
+    alphas, coefs, done = job.snapshot()
+    if len(alphas) == shown and not done:
+        raise PreventUpdate
+    fig = _path_figure(
+        *_subsample(alphas, coefs, len(job.alphas), spec["max_alphas"]),
+        set(spec["highlighted"]),
+        render=spec["render"],
+        digits=spec["figure_digits"],
+    )
+    return fig, _status_text(job, len(alphas), done), done, len(alphas)
+
+
+def register_lasso_path_callbacks(app):
+    """Register the polling callback used by ``progressive=True`` path components."""
+
+    if not register_once(app, "lasso-path"):
+        return
+
+    app.callback(
+        Output({"type": "lasso-path-graph", "uid": MATCH}, "figure"),
+        Output({"type": "lasso-path-status", "uid": MATCH}, "children"),
+        Output({"type": "lasso-path-poll", "uid": MATCH}, "disabled"),
+        Output({"type": "lasso-path-shown", "uid": MATCH}, "data"),
+        Input({"type": "lasso-path-poll", "uid": MATCH}, "n_intervals"),
+        State({"type": "lasso-path-poll", "uid": MATCH}, "id"),
+        State({"type": "lasso-path-shown", "uid": MATCH}, "data"),
+        prevent_initial_call=True,
+    )(_poll_path)
+
+
 def make_lasso_path_component(
     app,
     uid="lasso-path",
@@ -22,6 +294,10 @@ def make_lasso_path_component(
     target_signal_noise_ratio=5.0,
     alphas=None,
     highlight_true_support=True,
+    render="svg",
+    max_alphas=None,
+    progressive=False,
+    figure_digits=None,
 ):
     """
     Build a namespaced Dash component rendering LASSO coefficient paths.
@@ -42,63 +318,96 @@ def make_lasso_path_component(
         If None, uses np.logspace(-2, 2, 50).
     highlight_true_support : bool
         Thicken/brighten lines for indices used in beta_true.
+    render : {"svg", "webgl"}
+        "svg" draws one Scatter per coefficient. "webgl" uses Scattergl and
+        collapses every non-highlighted path into a single NaN-separated trace,
+        which keeps the figure small and responsive for p in the thousands.
+    max_alphas : int or None
+        If set, plot at most this many (evenly spaced) alphas from the path.
+        None means no cap for "svg" and 50 for "webgl".
+    progressive : bool
+        Return immediately and solve the path on a background thread, largest
+        alpha first; the graph polls for new alphas every 500 ms and fills in as
+        they arrive. Requires the callbacks from ``register_lasso_path_callbacks``.
+    figure_digits : int or None
+        If set, send the figure's arrays as float32 rounded to this many
+        significant digits (see ``components.figures.compact_figure``).
+        None means full float64 for "svg" and 4 digits for "webgl".
 
     Returns
     -------
     dash.html.Div
         A container with title, subtitle, the Plotly graph, and a small meta section.
     """
-    # ----- Data generation (matches your script's structure) -----
-    rng = np.random.default_rng(seed)
-    X = rng.normal(size=(n, p))
-
-    beta_true = np.zeros(p)
-    # last index is p-1 to keep general for any p >= 120
-    support_indices = [19, 39, 59, 79, 99, min(119, p - 1)]
-    beta_true[support_indices] = [0.25, -0.75, 1.0, -3.5, 4.0, -6.0]
-
-    signal = X @ beta_true
-    sigma = np.std(signal) / np.sqrt(target_signal_noise_ratio)
-    noise = rng.normal(scale=sigma, size=n)
-    y = signal + noise
+    support_indices = _support_indices(p)
 
-    # LASSO path
     if alphas is None:
         alphas = np.logspace(-2, 2, 50)
-    alphas, coefs, _ = lasso_path(X, y, alphas=alphas)  # coefs shape: (p, n_alphas)
+    if render == "webgl":
+        if max_alphas is None:
+            max_alphas = _WEBGL_MAX_ALPHAS
+        if figure_digits is None:
+            figure_digits = _WEBGL_FIGURE_DIGITS
 
     true_support = set(support_indices)
+    highlighted = true_support if highlight_true_support else set()
 
-    # ----- Build Plotly figure -----
-    traces = []
-    for j, coef_path in enumerate(coefs):
-        is_true = (j in true_support) and highlight_true_support
-        traces.append(
-            go.Scatter(
-                x=alphas,
-                y=coef_path,
-                mode="lines",
-                name=f"β[{j}]",
-                # Use f-string and escape braces so Plotly gets %{x}/%{y} placeholders
-                hovertemplate=f"alpha=%{{x:.4f}}<br>coef=%{{y:.4f}}<extra>β[{j}]</extra>",
-                line=dict(width=2 if is_true else 1, dash="solid"),
-                opacity=1.0 if is_true else 0.5,
-                showlegend=False,
-            )
+    if progressive:
+        register_lasso_path_callbacks(app)
+        job = _path_job(
+            uid,
+            {
+                "n": n,
+                "p": p,
+                "seed": seed,
+                "target_signal_noise_ratio": target_signal_noise_ratio,
+                "alphas": [float(a) for a in alphas],
+                "highlighted": sorted(highlighted),
+                "render": render,
+                "max_alphas": max_alphas,
+                "figure_digits": figure_digits,
+            },
+        )
+        done_alphas, done_coefs, done = job.snapshot()
+        fig = _path_figure(
+            *_subsample(done_alphas, done_coefs, len(job.alphas), max_alphas),
+            highlighted,
+            render=render,
+            digits=figure_digits,
         )
+        progress = [
+            html.Div(
+                _status_text(job, len(done_alphas), done),
+                id={"type": "lasso-path-status", "uid": uid},
+                style=STYLES["status"],
+            ),
+            dcc.Interval(id={"type": "lasso-path-poll", "uid": uid}, interval=500, disabled=done),
+            dcc.Store(id={"type": "lasso-path-shown", "uid": uid}, data=len(done_alphas)),
+        ]
+    else:
+        def _compute_path():
+            from sklearn.linear_model import lasso_path
 
-    layout = go.Layout(
-        title="LASSO Coefficient Paths (Synthetic)",
-        xaxis=dict(title="Lambda (Regularization Strength)", type="log"),
-        yaxis=dict(title="Coefficient Value"),
-        hovermode="closest",
-        margin=dict(l=60, r=20, t=60, b=60),
-        plot_bgcolor="#fff",
-        paper_bgcolor="#fff",
-        height=650,
-        font=dict(family=STYLES["wrap"]["fontFamily"], size=14),
-    )
-    fig = go.Figure(data=traces, layout=layout)
+            X, y = _simulate(n, p, seed, target_signal_noise_ratio)
+            # LASSO path
+            path_alphas, path_coefs, _ = lasso_path(X, y, alphas=alphas)  # coefs shape: (p, n_alphas)
+            return {"alphas": path_alphas, "coefs": path_coefs}
+
+        # Loaded from the on-disk artifact cache when these parameters were solved before.
+        path = cached_arrays(
+            "lasso-path",
+            _cache_params(n, p, seed, target_signal_noise_ratio, alphas),
+            _compute_path,
+        )
+
+        # ----- Build Plotly figure -----
+        fig = _path_figure(
+            *_subsample(path["alphas"], path["coefs"], len(path["alphas"]), max_alphas),
+            highlighted,
+            render=render,
+            digits=figure_digits,
+        )
+        progress = []
 
     # ----- Component -----
     return html.Div(
@@ -112,8 +421,9 @@ def make_lasso_path_component(
                 style=STYLES["subtitle"],
                 id=f"{uid}-subtitle",
             ),
+            *progress,
             dcc.Graph(
-                id=f"{uid}-graph",
+                id={"type": "lasso-path-graph", "uid": uid},
                 figure=fig,
                 config={"displayModeBar": True, "responsive": True},
                 style={"height": "650px"},
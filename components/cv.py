@@ -0,0 +1,135 @@
+"""K-fold cross-validation of the LASSO path, with the folds solved in parallel.
+
+Each fold standardizes its own training rows, solves the whole alpha grid as one
+warm-started, screened path (``components/path_engine.py``) and scores every
+alpha on its held-out rows with a single matrix product. Within a fold the
+alphas depend on each other through the warm starts, so the parallelism is
+across folds: they run on joblib's ``loky`` process pool, which memory-maps
+large inputs instead of copying them into every worker.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from components.path_engine import screened_lasso_path
+
+# Processes forked after this import (gunicorn workers, Dash background jobs)
+# solve in-process by default: they share the machine with their siblings, and
+# a pool started inside a short-lived child costs seconds and is not cleaned up.
+_IMPORT_PID = os.getpid()
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes, e.g. before forking; the next call restarts them."""
+    # joblib is imported on first use; if it has not been, there is no pool.
+    if "joblib.externals.loky" not in sys.modules:
+        return
+    from joblib.externals.loky import get_reusable_executor
+
+    get_reusable_executor().shutdown(wait=True)
+
+
+@dataclass(frozen=True)
+class CVResult:
+    """Held-out mean squared error of every fold at every alpha."""
+
+    alphas: np.ndarray
+    fold_mse: np.ndarray  # (k, len(alphas))
+
+    @property
+    def mean_mse(self) -> np.ndarray:
+        return self.fold_mse.mean(axis=0)
+
+    @property
+    def se_mse(self) -> np.ndarray:
+        k = self.fold_mse.shape[0]
+        return self.fold_mse.std(axis=0, ddof=1) / np.sqrt(k)
+
+    @property
+    def index_min(self) -> int:
+        return int(np.argmin(self.mean_mse))
+
+    @property
+    def index_1se(self) -> int:
+        """Largest alpha whose mean error is within one SE of the minimum."""
+        i = self.index_min
+        within = self.mean_mse <= self.mean_mse[i] + self.se_mse[i]
+        candidates = np.flatnonzero(within)
+        return int(candidates[np.argmax(self.alphas[candidates])])
+
+    @property
+    def alpha_min(self) -> float:
+        return float(self.alphas[self.index_min])
+
+    @property
+    def alpha_1se(self) -> float:
+        return float(self.alphas[self.index_1se])
+
+
+def _fold_mse(X, y, train, test, alphas, tol, max_iter) -> np.ndarray:
+    X_train, y_train = X[train], y[train]
+    mean = X_train.mean(axis=0)
+    scale = X_train.std(axis=0)
+    scale[scale == 0] = 1.0
+    X_train = (X_train - mean) / scale
+    y_mean = y_train.mean()
+
+    coefs = screened_lasso_path(
+        X_train, y_train - y_mean, alphas, tol=tol, max_iter=max_iter
+    )
+    preds = ((X[test] - mean) / scale) @ coefs.T + y_mean
+    return ((y[test][:, None] - preds) ** 2).mean(axis=0)
+
+
+def default_jobs(k: int) -> int:
+    """Up to ``k`` worker processes, capped by the CPUs this process may use.
+
+    Returns 1 (solve in-process) in a process forked after this module was
+    imported, such as a gunicorn worker or a Dash background job.
+    """
+    if os.getpid() != _IMPORT_PID:
+        return 1
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    return max(1, min(k, cpus))
+
+
+def kfold_lasso_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    alphas: Sequence[float],
+    *,
+    k: int = 5,
+    seed: int = 0,
+    n_jobs: Optional[int] = None,
+    tol: float = 1e-4,
+    max_iter: int = 1000,
+) -> CVResult:
+    """Cross-validate the LASSO over ``alphas`` with shuffled ``k``-fold splits.
+
+    ``X`` and ``y`` are raw; each fold standardizes ``X`` and centers ``y`` on
+    its own training rows, so nothing leaks from the held-out fold.
+    ``n_jobs=None`` uses ``default_jobs(k)`` (one process per fold, or
+    in-process inside forked workers); ``n_jobs=1`` always runs in-process.
+    """
+
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import KFold
+
+    if k < 2:
+        raise ValueError(f"k must be at least 2, got {k}")
+    alphas = np.asarray(alphas, dtype=float)
+    folds = KFold(n_splits=k, shuffle=True, random_state=seed).split(X)
+    fold_mse = Parallel(n_jobs=n_jobs or default_jobs(k), backend="loky")(
+        delayed(_fold_mse)(X, y, train, test, alphas, tol, max_iter)
+        for train, test in folds
+    )
+    return CVResult(alphas, np.asarray(fold_mse))
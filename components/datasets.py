@@ -0,0 +1,143 @@
+"""Shared, reproducible synthetic datasets for the demos.
+
+Every generator is keyed by its arguments and returns read-only arrays.
+``sparse_regression`` and ``econ_indicators`` return the same object for the
+same key within a process (so components share buffers), and across processes
+``sparse_regression`` arrays come from the on-disk artifact cache as read-only
+memory maps, so every worker maps the same pages instead of regenerating and
+holding its own copy. The slider-driven draws are never persisted, and
+``integer_design`` is redrawn on every call: its caller caches what it renders.
+
+The random streams match the code the components used to carry inline, so
+figures and fits are unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+from components.artifact_cache import cached_arrays
+
+# True coefficients shared by the LASSO demos (indices differ per demo).
+DEFAULT_COEFS = (0.25, -0.75, 1.0, -3.5, 4.0, -6.0)
+
+_DTYPES = {"float64": np.float64, "float32": np.float32}
+
+
+@dataclass(frozen=True)
+class SparseRegression:
+    """``y = X β + ε`` with a sparse ``β`` and noise scaled to a target SNR."""
+
+    X: np.ndarray
+    y: np.ndarray
+    beta: np.ndarray
+    sigma: float
+
+    @property
+    def support(self) -> np.ndarray:
+        return np.flatnonzero(self.beta)
+
+
+@dataclass(frozen=True)
+class EconIndicators:
+    """Toy macro data: unemployment = 6 + 0.5·inflation − 0.7·gdp_growth + ε."""
+
+    inflation: np.ndarray
+    gdp_growth: np.ndarray
+    unemployment: np.ndarray
+
+
+def _read_only(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    # Memory maps from the cache already are; freshly computed arrays are not.
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=16)
+def sparse_regression(
+    n: int,
+    p: int,
+    *,
+    seed: int = 0,
+    support: Tuple[int, ...],
+    coefs: Tuple[float, ...] = DEFAULT_COEFS,
+    snr: float = 5.0,
+    dtype: str = "float64",
+) -> SparseRegression:
+    """Gaussian design with ``β[support] = coefs`` and noise at ``snr``.
+
+    ``dtype="float32"`` halves the memory (and cache size) of large designs; it
+    draws from the same seed but is a different dataset from the float64 one.
+    """
+
+    if dtype not in _DTYPES:
+        raise ValueError(f"dtype must be one of {sorted(_DTYPES)}, got {dtype!r}")
+    if len(support) != len(coefs):
+        raise ValueError("support and coefs must have the same length")
+
+    def _generate():
+        rng = np.random.default_rng(seed)
+        X = rng.standard_normal((n, p), dtype=_DTYPES[dtype])
+
+        beta = np.zeros(p)
+        beta[list(support)] = coefs
+
+        signal = X @ beta
+        sigma = np.std(signal) / np.sqrt(snr)
+        noise = rng.normal(scale=sigma, size=n)
+        y = (signal + noise).astype(_DTYPES[dtype], copy=False)
+        return {"X": X, "y": y, "beta": beta, "sigma": np.asarray(sigma)}
+
+    arrays = _read_only(
+        cached_arrays(
+            "dataset-sparse",
+            {
+                "n": n,
+                "p": p,
+                "seed": seed,
+                "support": list(support),
+                "coefs": list(coefs),
+                "snr": snr,
+                "dtype": dtype,
+            },
+            _generate,
+        )
+    )
+    return SparseRegression(arrays["X"], arrays["y"], arrays["beta"], float(arrays["sigma"]))
+
+
+def integer_design(n: int, p: int, seed: int, low: int = -9, high: int = 9) -> np.ndarray:
+    """Design with integer entries in ``[low, high]``, as float.
+
+    Not cached: the full-rank demo draws a fresh seed on every click and
+    memoizes what it renders, so keeping X (up to 32 MB) would only pin memory.
+    """
+
+    X = np.random.default_rng(seed).integers(low, high + 1, size=(n, p)).astype(float)
+    X.flags.writeable = False
+    return X
+
+
+@lru_cache(maxsize=8)
+def econ_indicators(n: int, seed: int, noise: float = 0.5) -> EconIndicators:
+    """Inflation (0–10 %), GDP growth (−2–6 %) and the unemployment they imply.
+
+    ``noise`` is the standard deviation of ε, in percentage points. Kept in
+    process memory only, like ``integer_design``: every slider setting is a new
+    key, and a few hundred rows are quicker to draw than to read back.
+    """
+
+    rng = np.random.default_rng(seed)
+    inflation = rng.random((n, 1)) * 10
+    gdp_growth = rng.random((n, 1)) * 8 - 2
+    eps = rng.standard_normal(n) * noise
+    unemployment = 6 + 0.5 * inflation.ravel() - 0.7 * gdp_growth.ravel() + eps
+    arrays = _read_only(
+        {"inflation": inflation, "gdp_growth": gdp_growth, "unemployment": unemployment}
+    )
+    return EconIndicators(arrays["inflation"], arrays["gdp_growth"], arrays["unemployment"])
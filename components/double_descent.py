@@ -0,0 +1,145 @@
+"""Component plotting OLS versus LASSO test error as p/n sweeps through 1."""
+
+from __future__ import annotations
+
+from typing import Dict
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import dcc, html
+
+from components.figures import compact_figure
+from components.monte_carlo import default_p_grid, sweep_test_error
+
+_STYLES: Dict[str, Dict[str, str]] = {
+    "wrap": {
+        "maxWidth": "980px",
+        "margin": "1.5rem auto",
+        "fontFamily": "system-ui, Arial, sans-serif",
+        "color": "#202124",
+    },
+    "introTitle": {"fontSize": "22px", "fontWeight": 700, "marginBottom": "0.5rem"},
+    "introText": {"fontSize": "15px", "lineHeight": "1.6", "marginBottom": "1rem"},
+}
+
+_SERIES = (
+    ("OLS (minimum norm)", "ols_mse", "31, 119, 180"),
+    ("LASSO", "lasso_mse", "198, 40, 40"),
+)
+
+
+def _error_figure(result) -> go.Figure:
+    ratios = result.ratios
+    fig = go.Figure()
+    for name, key, rgb in _SERIES:
+        q25, median, q75 = np.percentile(getattr(result, key), [25, 50, 75], axis=1)
+        fig.add_trace(
+            go.Scatter(
+                x=ratios,
+                y=q75,
+                mode="lines",
+                line={"width": 0},
+                legendgroup=key,
+                showlegend=False,
+                hoverinfo="skip",
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=ratios,
+                y=q25,
+                mode="lines",
+                line={"width": 0},
+                fill="tonexty",
+                fillcolor=f"rgba({rgb}, 0.2)",
+                legendgroup=key,
+                showlegend=False,
+                hoverinfo="skip",
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=ratios,
+                y=median,
+                mode="lines+markers",
+                name=name,
+                legendgroup=key,
+                line={"color": f"rgb({rgb})"},
+                marker={"size": 4},
+                customdata=result.p,
+                hovertemplate="p = %{customdata}<br>median test MSE = %{y:.3g}",
+            )
+        )
+
+    # Shapes on log axes are positioned in log10 units.
+    fig.add_vline(
+        x=0.0,
+        line_dash="dash",
+        line_color="#555",
+        annotation_text="interpolation threshold (p = n)",
+        annotation_position="top right",
+    )
+    fig.add_hline(
+        y=np.log10(result.sigma**2),
+        line_dash="dot",
+        line_color="#888",
+        annotation_text="noise floor σ²",
+        annotation_position="bottom right",
+    )
+    fig.update_layout(
+        title=f"Test error versus p/n (n = {result.n}, {result.ols_mse.shape[1]} seeds per p)",
+        xaxis={"title": "p / n", "type": "log"},
+        yaxis={"title": "test MSE (median, interquartile band)", "type": "log"},
+        height=450,
+        margin={"l": 60, "r": 20, "t": 60, "b": 50},
+        template="plotly_white",
+        legend={"orientation": "h", "y": -0.2},
+    )
+    return fig
+
+
+def make_double_descent_component(
+    app,
+    uid: str = "double-descent",
+    *,
+    n: int = 100,
+    n_seeds: int = 50,
+    snr: float = 5.0,
+    max_ratio: float = 4.0,
+    figure_digits=None,
+) -> html.Div:
+    """Monte Carlo curve of OLS and LASSO test error across p/n.
+
+    Every point summarizes ``n_seeds`` simulated datasets
+    (``components/monte_carlo.py``). The sweep runs on a process pool the first
+    time and is loaded from the artifact cache afterwards; the plot itself needs
+    no callbacks, so it also works in the static export.
+    """
+
+    result = sweep_test_error(n, default_p_grid(n, max_ratio), n_seeds=n_seeds, snr=snr)
+    fig = _error_figure(result)
+    if figure_digits is not None:
+        compact_figure(fig, figure_digits)
+
+    return html.Div(
+        id={"type": "double-descent-wrap", "uid": uid},
+        style=_STYLES["wrap"],
+        children=[
+            html.H2(
+                "What Happens to OLS as p Approaches n",
+                style=_STYLES["introTitle"],
+            ),
+            html.P(
+                "Each point below fits ordinary least squares and LASSO to simulated "
+                f"data with n = {n} observations, five true predictors and a growing "
+                "number of irrelevant ones. Below p = n, OLS test error creeps up as "
+                "noise predictors are added. At p = n, the model can interpolate the "
+                "training data exactly, and its test error explodes. Past that point, "
+                "the minimum-norm solution spreads the fit over many predictors and "
+                "the error falls again: the 'double descent' curve. LASSO, by "
+                "contrast, stays close to the noise floor throughout.",
+                style=_STYLES["introText"],
+            ),
+            dcc.Graph(figure=fig, config={"displayModeBar": False}),
+        ],
+    )
@@ -1,58 +1,94 @@
 # econometrics_component.py
+from functools import lru_cache
+
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from dash import html, dcc
+from dash import MATCH, Input, Output, State, html, dcc
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 
-def make_econ_component(app, uid="econ", *, n=50, seed=42):
-    """
-    Returns a namespaced, self-contained Dash component that:
-      - generates data (inflation, gdp_growth, unemployment),
-      - fits simple and multiple linear regressions,
-      - shows a Plotly scatter with fitted line,
-      - prints coefficients below the plot.
+from components.datasets import econ_indicators
+from components.figures import compact_figure
+from components.ols import bootstrap_ols, ols
+from components.utils import register_once
+
+# Slider ranges: (low, high, step).
+_N_RANGE = (20, 500, 10)
+_NOISE_RANGE = (0.1, 3.0, 0.1)
+_SEED_RANGE = (0, 99, 1)
+_BOOT_RANGE = (500, 5000, 500)
 
-    Use: app.layout = html.Div([ make_regression_component(app, uid="econ1") ])
+_X_LINE = np.linspace(0, 10, 100)  # inflation grid for the fitted line
+_BAND = (2.5, 97.5)  # percentile bootstrap interval, in percent
+
+
+@lru_cache(maxsize=128)
+def _econ_outputs(n, noise, seed, n_boot, figure_digits=None):
+    """Figure and coefficient summaries for one setting of the sliders.
+
+    Both regressions go through the batched QR kernel in ``components/ols.py``.
+    The confidence band comes from ``n_boot`` case-resampling refits of the
+    simple regression, solved together in one stacked solve.
     """
 
     # ---------------------------
-    # 1) Generate data (same logic as your snippet)
+    # 1) Generate data
     # ---------------------------
-    rng = np.random.default_rng(seed)
-    inflation = rng.random((n, 1)) * 10                    # 0..10
-    gdp_growth = rng.random((n, 1)) * 8 - 2                # -2..6
-    noise = rng.standard_normal(n) * 0.5
-    unemployment = 6 + 0.5*inflation.flatten() - 0.7*gdp_growth.flatten() + noise
+    data = econ_indicators(n, seed, noise)
+    inflation = data.inflation                             # 0..10
+    gdp_growth = data.gdp_growth                           # -2..6
+    unemployment = data.unemployment
 
     # ---------------------------
     # 2) Fit regressions
     # ---------------------------
     # Simple: Unemployment ~ Inflation
-    model_simple = LinearRegression()
-    model_simple.fit(inflation, unemployment)
-
-    x_line = np.linspace(0, 10, 100).reshape(-1, 1)
-    y_line = model_simple.predict(x_line)
+    b0, b1 = ols(inflation, unemployment)
+    y_line = b0 + b1 * _X_LINE
 
     # Multiple: Unemployment ~ Inflation + GDP Growth
-    X_multi = np.hstack([inflation, gdp_growth])
-    model_multi = LinearRegression()
-    model_multi.fit(X_multi, unemployment)
+    multi = ols(np.hstack([inflation, gdp_growth]), unemployment)
+
+    # Bootstrap: every replicate's line over the grid, then pointwise percentiles.
+    boot = bootstrap_ols(inflation, unemployment, n_boot, seed=seed)
+    band_lo, band_hi = np.percentile(boot[:, :1] + boot[:, 1:2] * _X_LINE, _BAND, axis=0)
+    slope_lo, slope_hi = np.percentile(boot[:, 1], _BAND)
 
     # ---------------------------
     # 3) Build Plotly figure
     # ---------------------------
+    level = f"{_BAND[1] - _BAND[0]:g}%"
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=inflation.flatten(),
+        x=_X_LINE,
+        y=band_hi,
+        mode="lines",
+        line=dict(width=0),
+        hoverinfo="skip",
+        showlegend=False,
+    ))
+    fig.add_trace(go.Scatter(
+        x=_X_LINE,
+        y=band_lo,
+        mode="lines",
+        line=dict(width=0),
+        fill="tonexty",
+        fillcolor="rgba(255, 127, 14, 0.25)",
+        name=f"{level} bootstrap band ({n_boot} refits)",
+        hoverinfo="skip",
+    ))
+    fig.add_trace(go.Scatter(
+        x=inflation.ravel(),
         y=unemployment,
         mode="markers",
+        # Smaller, translucent points once they start to overlap.
+        marker=dict(size=6 if n <= 300 else 4, opacity=1.0 if n <= 300 else 0.5),
         name="Data points"
     ))
     fig.add_trace(go.Scatter(
-        x=x_line.flatten(),
+        x=_X_LINE,
         y=y_line,
         mode="lines",
+        line=dict(color="#ff7f0e"),
         name="Fitted line"
     ))
     fig.update_layout(
@@ -62,20 +98,138 @@ def make_econ_component(app, uid="econ", *, n=50, seed=42):
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         margin=dict(l=40, r=20, t=60, b=40),
     )
+    if figure_digits is not None:
+        compact_figure(fig, figure_digits)
 
     # ---------------------------
     # 4) Format outputs
     # ---------------------------
     simple_txt = (
         f"Simple regression results:\n"
-        f"Intercept (β0): {model_simple.intercept_:.2f}\n"
-        f"Slope for Inflation (β1): {model_simple.coef_[0]:.2f}"
+        f"Intercept (β0): {b0:.2f}\n"
+        f"Slope for Inflation (β1): {b1:.2f} "
+        f"({level} bootstrap CI {slope_lo:.2f} to {slope_hi:.2f})"
     )
     multi_txt = (
         f"Multiple regression results:\n"
-        f"Intercept (β0): {model_multi.intercept_:.2f}\n"
-        f"Slope for Inflation (β1): {model_multi.coef_[0]:.2f}\n"
-        f"Slope for GDP Growth (β2): {model_multi.coef_[1]:.2f}"
+        f"Intercept (β0): {multi[0]:.2f}\n"
+        f"Slope for Inflation (β1): {multi[1]:.2f}\n"
+        f"Slope for GDP Growth (β2): {multi[2]:.2f}"
+    )
+    return fig, simple_txt, multi_txt
+
+
+def econ_cache_info():
+    """Hit/miss counters for the memoized econometrics outputs."""
+    return _econ_outputs.cache_info()
+
+
+def _in_range(value, value_range):
+    low, high, _ = value_range
+    return low <= value <= high
+
+
+def _update(n, noise, seed, n_boot, params):
+    if None in (n, noise, seed, n_boot):
+        raise PreventUpdate
+    try:
+        # Slider floats such as 0.30000000000000004 would otherwise miss the cache.
+        n, noise, seed, n_boot = int(n), round(float(noise), 2), int(seed), int(n_boot)
+        digits = params.get("figure_digits")
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        raise PreventUpdate
+    # Values come from the browser: bootstrap_ols allocates (n_boot, n) counts,
+    # so anything the sliders cannot produce is refused.
+    ranges = ((n, _N_RANGE), (noise, _NOISE_RANGE), (seed, _SEED_RANGE), (n_boot, _BOOT_RANGE))
+    if not all(_in_range(value, value_range) for value, value_range in ranges):
+        raise PreventUpdate
+    if digits is not None and not (isinstance(digits, int) and 1 <= digits <= 15):
+        raise PreventUpdate
+    return _econ_outputs(n, noise, seed, n_boot, digits)
+
+
+def register_econ_callbacks(app):
+    """Register the pattern-matching callback shared by every econometrics demo."""
+
+    if not register_once(app, "econ"):
+        return
+
+    app.callback(
+        Output({"type": "econ-fig", "uid": MATCH}, "figure"),
+        Output({"type": "econ-simple", "uid": MATCH}, "children"),
+        Output({"type": "econ-multi", "uid": MATCH}, "children"),
+        Input({"type": "econ-n", "uid": MATCH}, "value"),
+        Input({"type": "econ-noise", "uid": MATCH}, "value"),
+        Input({"type": "econ-seed", "uid": MATCH}, "value"),
+        Input({"type": "econ-boot", "uid": MATCH}, "value"),
+        State({"type": "econ-params", "uid": MATCH}, "data"),
+        prevent_initial_call=True,
+    )(_update)
+
+
+def _slider(label, slider_id, value, value_range):
+    low, high, step = value_range
+    return html.Div(
+        [
+            html.Div(label, style={"fontSize": "14px", "fontWeight": 600, "marginBottom": "0.25rem"}),
+            dcc.Slider(
+                id=slider_id,
+                min=low,
+                max=high,
+                step=step,
+                value=value,
+                marks={low: f"{low:g}", high: f"{high:g}"},
+                tooltip={"placement": "bottom", "always_visible": False},
+            ),
+        ]
+    )
+
+
+def make_econ_component(
+    app,
+    uid="econ",
+    *,
+    n=50,
+    seed=42,
+    noise=0.5,
+    n_boot=2000,
+    interactive=True,
+    figure_digits=None,
+):
+    """
+    Returns a namespaced, self-contained Dash component that:
+      - generates data (inflation, gdp_growth, unemployment),
+      - fits simple and multiple linear regressions,
+      - shows a Plotly scatter with the fitted line and a bootstrap band,
+      - prints coefficients below the plot.
+
+    Sliders for n, the noise level, the seed and the number of bootstrap
+    refits redraw everything on the server; results are memoized per setting.
+    interactive=False leaves the sliders out (they need the server).
+
+    figure_digits: if set, the figure's arrays are sent as float32 rounded to
+    this many significant digits.
+
+    Use: app.layout = html.Div([ make_econ_component(app, uid="econ1") ])
+    """
+
+    register_econ_callbacks(app)
+    fig, simple_txt, multi_txt = _econ_outputs(n, noise, seed, n_boot, figure_digits)
+
+    controls = html.Div(
+        style={
+            "display": "grid" if interactive else "none",
+            "gridTemplateColumns": "repeat(auto-fit, minmax(180px, 1fr))",
+            "gap": "0.75rem 1.5rem",
+            "margin": "0 auto 1rem auto",
+            "maxWidth": 800,
+        },
+        children=[
+            _slider("Observations (n)", {"type": "econ-n", "uid": uid}, n, _N_RANGE),
+            _slider("Noise σ (pp)", {"type": "econ-noise", "uid": uid}, noise, _NOISE_RANGE),
+            _slider("Seed", {"type": "econ-seed", "uid": uid}, seed, _SEED_RANGE),
+            _slider("Bootstrap refits", {"type": "econ-boot", "uid": uid}, n_boot, _BOOT_RANGE),
+        ],
     )
 
     # ---------------------------
@@ -95,13 +249,21 @@ High-dimensional regression is central in many fields:
             html.P('In all of these areas, being able to identify the few predictors that matter is essential. This is why Lasso regression has become a cornerstone of high-dimensional analysis. It connects classical regression ideas to the demands of today’s big data world'),
             html.H3("Econometrics Demo", style={"textAlign": "center", "marginBottom": "0.4rem"}),
             html.P(
-                "Scatter of unemployment vs inflation with the OLS fitted line; "
-                "coefficients shown below (multiple regression includes GDP growth).",
+                "Scatter of unemployment vs inflation with the OLS fitted line and a "
+                "bootstrap confidence band; coefficients shown below (multiple "
+                "regression includes GDP growth). Change the sample size, noise or "
+                "seed to see how much the fit moves.",
                 style={"textAlign": "center", "marginTop": 0, "marginBottom": "1rem"}
             ),
-            dcc.Graph(id=f"{uid}-fig", figure=fig, style={"maxWidth": 800, "margin": "0 auto"}),
-            html.Pre(simple_txt, id=f"{uid}-simple", style={"whiteSpace": "pre-wrap", "fontSize": "0.95rem"}),
-            html.Pre(multi_txt, id=f"{uid}-multi", style={"whiteSpace": "pre-wrap", "fontSize": "0.95rem"}),
+            controls,
+            dcc.Graph(
+                id={"type": "econ-fig", "uid": uid},
+                figure=fig,
+                style={"maxWidth": 800, "margin": "0 auto"},
+            ),
+            html.Pre(simple_txt, id={"type": "econ-simple", "uid": uid}, style={"whiteSpace": "pre-wrap", "fontSize": "0.95rem"}),
+            html.Pre(multi_txt, id={"type": "econ-multi", "uid": uid}, style={"whiteSpace": "pre-wrap", "fontSize": "0.95rem"}),
+            dcc.Store(id={"type": "econ-params", "uid": uid}, data={"figure_digits": figure_digits}),
         ],
         # Inline styles + uid namespacing minimize interference from other page styles
         style={"padding": "1rem", "border": "1px solid #eee", "borderRadius": "12px", "maxWidth": "900px", "margin": "1rem auto"}
@@ -0,0 +1,39 @@
+"""Helpers that shrink Plotly figures before they are sent to the browser."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Trace attributes that hold the plotted numbers.
+_DATA_KEYS = ("x", "y", "z")
+
+
+def round_significant(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round ``values`` to ``digits`` significant digits (NaN and inf pass through)."""
+
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values) & (values != 0)
+    magnitude = np.zeros_like(values)
+    magnitude[finite] = np.floor(np.log10(np.abs(values[finite])))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.where(finite, np.round(values * scale) / scale, values)
+
+
+def compact_figure(fig, digits: int = 4):
+    """Store every numeric trace array as rounded float32, in place.
+
+    Plotly serializes numpy arrays as base64 typed arrays; float32 halves them,
+    and rounding zeroes the low mantissa bits so gzip/brotli compress them well.
+    Four significant digits are far below what a plot can show.
+    """
+
+    for trace in fig.data:
+        for key in _DATA_KEYS:
+            values = trace[key] if key in trace else None
+            if values is None or isinstance(values, str):
+                continue
+            arr = np.asarray(values)
+            if arr.dtype.kind not in "iuf":
+                continue  # dates, category labels, ...
+            trace[key] = round_significant(arr, digits).astype(np.float32)
+    return fig
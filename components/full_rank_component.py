@@ -3,123 +3,445 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import numpy as np
+import plotly.graph_objects as go
 from dash import MATCH, Input, Output, State, dcc, html, no_update
+from dash.exceptions import PreventUpdate
+
+from components.background import background_options, shared_memoize
+from components.datasets import integer_design
+from components.linalg import diagnose_design
+from components.utils import register_once
+
+_DEBUG = False  # Toggle to True for console diagnostics.
+
+_rng = np.random.default_rng(2024)
+
+_RENDER_CACHE_SIZE = 512
+# Designs with at least this many entries (about 0.2 s to render on one core)
+# go to a background job; smaller ones render faster than one poll would take.
+_BACKGROUND_MIN_ENTRIES = 1_000_000
+
+_STYLES: Dict[str, Dict[str, str]] = {
+    "wrap": {
+        "maxWidth": "980px",
+        "margin": "1.5rem auto",
+        "fontFamily": "system-ui, Arial, sans-serif",
+        "color": "#202124",
+    },
+    "introTitle": {"fontSize": "22px", "fontWeight": 700, "marginBottom": "0.5rem"},
+    "introText": {"fontSize": "15px", "lineHeight": "1.6", "marginBottom": "1rem"},
+    "controls": {
+        "display": "grid",
+        "gridTemplateColumns": "repeat(auto-fit, minmax(240px, 1fr))",
+        "gap": "1rem",
+        "alignItems": "center",
+        "marginBottom": "1rem",
+    },
+    "sliderLabel": {"fontWeight": 600, "marginBottom": "0.25rem"},
+    "warning": {
+        "backgroundColor": "#fdecea",
+        "border": "1px solid #f5c6c1",
+        "color": "#b71c1c",
+        "padding": "0.75rem 1rem",
+        "borderRadius": "8px",
+        "fontWeight": 600,
+        "marginBottom": "1rem",
+        "display": "none",
+    },
+    "warningActive": {
+        "backgroundColor": "#fdecea",
+        "border": "1px solid #f5c6c1",
+        "color": "#b71c1c",
+        "padding": "0.75rem 1rem",
+        "borderRadius": "8px",
+        "fontWeight": 600,
+        "marginBottom": "1rem",
+        "display": "block",
+    },
+    "summary": {
+        "backgroundColor": "#f5f7fb",
+        "borderRadius": "8px",
+        "padding": "0.75rem 1rem",
+        "marginBottom": "1rem",
+        "fontSize": "14px",
+        "lineHeight": "1.6",
+    },
+    "matrixStack": {
+        "display": "flex",
+        "flexDirection": "column",
+        "gap": "1.25rem",
+    },
+    "panel": {
+        "backgroundColor": "#ffffff",
+        "border": "1px solid #e2e5ed",
+        "borderRadius": "10px",
+        "padding": "1rem",
+        "boxShadow": "0 4px 10px rgba(15, 35, 95, 0.04)",
+    },
+    "panelTitle": {
+        "fontSize": "16px",
+        "fontWeight": 700,
+        "marginBottom": "0.75rem",
+    },
+    "matrixText": {
+        "fontFamily": "Menlo, Consolas, monospace",
+        "fontSize": "12px",
+        "whiteSpace": "pre",
+        "overflowX": "auto",
+        "overflowY": "auto",
+        "maxHeight": "320px",
+        "backgroundColor": "#fafcff",
+        "padding": "0.75rem",
+        "borderRadius": "8px",
+        "border": "1px solid #e2e5ed",
+    },
+    "inverseMessage": {"color": "#6b7280", "fontStyle": "italic"},
+}
+
+_PRESETS = {
+    "normal": (100, 5),
+    "near": (40, 8),
+    "square": (10, 10),
+    "wide": (6, 10),
+    "large": (2000, 400),
+    "wide_large": (500, 2000),
+}
+
+_MAX_N = 2000
+# p reaches the thousands. The cost is one SVD of X: a square 2000 × 2000 design
+# takes about 5 s on one core and runs as a background job; wide designs
+# (p > n) only need singular values and stay around a second.
+_MAX_P = 2000
+_MAX_SEED = 10_000_000
+# Matrices up to the original 100 × 10 demo size are printed in full; larger
+# ones get a corner summary plus a block-averaged heatmap, so the payload stays
+# bounded no matter how big n and p get.
+_TEXT_MAX_ENTRIES = 1000
+_HEATMAP_MAX_CELLS = 60
+
+
+def _matrix_block(
+    mat: np.ndarray,
+    *,
+    precision: int = 3,
+    suppress: bool = True,
+    floatmode: str = "maxprec_equal",
+) -> html.Pre:
+    with np.printoptions(
+        precision=precision,
+        suppress=suppress,
+        floatmode=floatmode,
+        threshold=_TEXT_MAX_ENTRIES,
+        edgeitems=3,
+    ):
+        rendered = np.array2string(mat, separator=", ")
+    return html.Pre(rendered, style=_STYLES["matrixText"])
+
+
+def _block_means(mat: np.ndarray, max_cells: int):
+    """Average ``mat`` over at most ``max_cells`` × ``max_cells`` contiguous blocks."""
+    n_rows, n_cols = mat.shape
+    row_edges = np.linspace(0, n_rows, min(max_cells, n_rows) + 1).astype(int)
+    col_edges = np.linspace(0, n_cols, min(max_cells, n_cols) + 1).astype(int)
+    sums = np.add.reduceat(
+        np.add.reduceat(mat, row_edges[:-1], axis=0), col_edges[:-1], axis=1
+    )
+    means = sums / np.outer(np.diff(row_edges), np.diff(col_edges))
+    return means, row_edges[:-1], col_edges[:-1]
+
+
+def _matrix_heatmap(mat: np.ndarray) -> dcc.Graph:
+    z, row_starts, col_starts = _block_means(mat, _HEATMAP_MAX_CELLS)
+    fig = go.Figure(
+        go.Heatmap(
+            z=z,
+            x=col_starts + 1,
+            y=row_starts + 1,
+            colorscale="RdBu",
+            zmid=0,
+            hovertemplate="rows %{y}…, cols %{x}…<br>block mean=%{z:.3g}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        height=280,
+        margin=dict(l=50, r=10, t=10, b=40),
+        xaxis_title="column",
+        yaxis=dict(title="row", autorange="reversed"),
+    )
+    return dcc.Graph(figure=fig, config={"displayModeBar": False})
+
+
+def _matrix_view(mat: np.ndarray, **block_kwargs):
+    if mat.size <= _TEXT_MAX_ENTRIES:
+        return _matrix_block(mat, **block_kwargs)
+    n_rows, n_cols = mat.shape
+    return html.Div(
+        [
+            html.Div(
+                f"{n_rows} × {n_cols} matrix: corner entries below, and a heatmap "
+                f"of block averages (at most {_HEATMAP_MAX_CELLS} × {_HEATMAP_MAX_CELLS}).",
+                style=_STYLES["inverseMessage"],
+            ),
+            _matrix_block(mat, **block_kwargs),
+            _matrix_heatmap(mat),
+        ]
+    )
+
+
+def _apply_preset(preset_key):
+    if preset_key is None:
+        return no_update, no_update
+    n_val, p_val = _PRESETS[preset_key]
+    return n_val, p_val
+
+
+def _update_seed(n_clicks, store_data):
+    if not n_clicks:
+        return store_data
+    next_seed = int(_rng.integers(0, _MAX_SEED))
+    return {"seed": next_seed}
+
+
+def _design_args(n_val, p_val, store_data):
+    """``(n, p, seed)`` from the browser, or ``PreventUpdate`` if the sliders cannot produce them."""
+    try:
+        seed = int(store_data.get("seed", 0)) if store_data else 0
+        n_val, p_val = int(n_val), int(p_val)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        raise PreventUpdate
+    if not (1 <= n_val <= _MAX_N and 1 <= p_val <= _MAX_P and 0 <= seed < _MAX_SEED):
+        raise PreventUpdate
+    return n_val, p_val, seed
+
+
+def _is_large(n_val: int, p_val: int) -> bool:
+    return n_val * p_val >= _BACKGROUND_MIN_ENTRIES
+
+
+def _render(n_val, p_val, store_data):
+    """Synchronous renderer, used when there is no background manager."""
+    if n_val is None or p_val is None:
+        return no_update, no_update, no_update, no_update
+
+    n_val, p_val, seed = _design_args(n_val, p_val, store_data)
+    if _is_large(n_val, p_val):
+        return _render_large_outputs(n_val, p_val, seed)
+    return _render_outputs(n_val, p_val, seed)
+
+
+def _render_or_defer(n_val, p_val, store_data, job):
+    """Render small designs inline; hand large ones to ``_render_job``."""
+    if n_val is None or p_val is None:
+        return no_update, no_update, no_update, no_update, no_update
+
+    n_val, p_val, seed = _design_args(n_val, p_val, store_data)
+    if _is_large(n_val, p_val):
+        return no_update, no_update, no_update, no_update, {
+            "n": n_val,
+            "p": p_val,
+            "seed": seed,
+        }
+    # Clearing a pending job restarts _render_job, which makes Dash terminate
+    # the stale solve before it can overwrite these outputs.
+    return (*_render_outputs(n_val, p_val, seed), None if job else no_update)
+
+
+def _render_job(job):
+    if not job:
+        raise PreventUpdate
+    return _render_large_outputs(job["n"], job["p"], job["seed"])
+
+
+def _build_outputs(n_val: int, p_val: int, seed: int):
+    X = integer_design(n_val, p_val, seed)
+
+    xtx = X.T @ X
+    # One SVD of X yields rank, cond(XᵀX) and the inverse.
+    diagnostics = diagnose_design(X)
+    rank = diagnostics.rank
+    condition_number = diagnostics.condition_number
+    is_full_rank = diagnostics.is_full_rank
+    near_singular = condition_number > 1e10
+
+    if _DEBUG:
+        print(">>> Checking matrix multiplication")
+        print(f"Seed: {seed}")
+        print(f"X shape: {X.shape}, dtype: {X.dtype}")
+        print(f"XᵀX shape: {xtx.shape}")
+        print("Sample X:\n", X[: min(5, n_val), : min(5, p_val)])
+        print("Sample XᵀX:\n", xtx[: min(5, p_val), : min(5, p_val)])
+
+    xtx_inv: Optional[np.ndarray] = None
+    inverse_message: Optional[str] = None
+    if is_full_rank and not near_singular:
+        xtx_inv = diagnostics.xtx_inv
+        if _DEBUG:
+            identity_check = xtx_inv @ xtx
+            print("Inverse computed.")
+            print("Inverse(XᵀX) @ XᵀX ≈ I ? ", np.allclose(identity_check, np.eye(p_val)))
+            print("Condition number:", condition_number)
+    else:
+        inverse_message = (
+            "XᵀX is singular or ill-conditioned; inverse not available."
+        )
+
+    warning_needed = not is_full_rank or near_singular
+    warning_children = []
+    warning_style = _STYLES["warning"]
+    if warning_needed:
+        warning_children = [
+            "⚠️ Warning: X is not full column rank! (XᵀX is singular or nearly singular)."
+        ]
+        warning_style = _STYLES["warningActive"]
+
+    summary_children = [
+        html.Div(f"n (rows of X): {n_val}"),
+        html.Div(f"p (columns of X): {p_val}"),
+        html.Div(f"rank(X): {rank}"),
+        html.Div(
+            f"Condition number of XᵀX: {'{:.2e}'.format(condition_number)}"
+            if math.isfinite(condition_number)
+            else "Condition number of XᵀX: undefined"
+        ),
+    ]
+    if inverse_message and xtx_inv is None:
+        summary_children.append(html.Div(inverse_message))
+
+    visuals_children: List[html.Div] = []
+
+    def _panel(title: str, body_children):
+        return html.Div(
+            style=_STYLES["panel"],
+            children=[
+                html.Div(title, style=_STYLES["panelTitle"]),
+                body_children,
+            ],
+        )
+
+    visuals_children.append(_panel("Design matrix X", _matrix_view(X, precision=0)))
+    visuals_children.append(
+        _panel("Cross-product XᵀX", _matrix_view(xtx, precision=2))
+    )
+    if xtx_inv is not None:
+        visuals_children.append(
+            _panel(
+                "Inverse (XᵀX)⁻¹",
+                _matrix_view(xtx_inv, precision=6, suppress=False),
+            )
+        )
+    else:
+        visuals_children.append(
+            _panel(
+                "Inverse (XᵀX)⁻¹",
+                html.Div(
+                    inverse_message or "Inverse not available.",
+                    style=_STYLES["inverseMessage"],
+                ),
+            )
+        )
+
+    return warning_children, warning_style, summary_children, visuals_children
+
+
+# The outputs depend only on (n, p, seed), so every instance and every user shares
+# one bounded cache. functools.lru_cache is thread-safe and tracks hits/misses.
+_render_outputs = lru_cache(maxsize=_RENDER_CACHE_SIZE)(_build_outputs)
+# Large designs are solved in background job processes, which start empty:
+# their results are memoized on disk, where the server and every job see them.
+_render_large_outputs = shared_memoize("fullrank-render")(_build_outputs)
+
+
+def render_cache_info():
+    """Return hit/miss counters for small designs, rendered in this process."""
+    return _render_outputs.cache_info()
+
+
+def large_render_cache_info():
+    """Return hit/miss counters for large designs, shared by all processes."""
+    return _render_large_outputs.cache_info()
+
+
+def register_full_rank_callbacks(app) -> None:
+    """Register the pattern-matching callbacks shared by every full-rank demo."""
+
+    if not register_once(app, "fullrank"):
+        return
+
+    app.callback(
+        Output({"type": "fullrank-n", "uid": MATCH}, "value"),
+        Output({"type": "fullrank-p", "uid": MATCH}, "value"),
+        Input({"type": "fullrank-preset", "uid": MATCH}, "value"),
+        prevent_initial_call=True,
+    )(_apply_preset)
+
+    app.callback(
+        Output({"type": "fullrank-store", "uid": MATCH}, "data"),
+        Input({"type": "fullrank-generate", "uid": MATCH}, "n_clicks"),
+        State({"type": "fullrank-store", "uid": MATCH}, "data"),
+        prevent_initial_call=True,
+    )(_update_seed)
+
+    outputs = [
+        Output({"type": "fullrank-warning", "uid": MATCH}, "children"),
+        Output({"type": "fullrank-warning", "uid": MATCH}, "style"),
+        Output({"type": "fullrank-summary", "uid": MATCH}, "children"),
+        Output({"type": "fullrank-visuals", "uid": MATCH}, "children"),
+    ]
+    inputs = [
+        Input({"type": "fullrank-n", "uid": MATCH}, "value"),
+        Input({"type": "fullrank-p", "uid": MATCH}, "value"),
+        Input({"type": "fullrank-store", "uid": MATCH}, "data"),
+    ]
+    # Large designs take a while: solve them off the request thread when
+    # possible and dim the stale matrices until the new ones arrive.
+    background = background_options(
+        app,
+        running=[
+            (
+                Output({"type": "fullrank-visuals", "uid": MATCH}, "style"),
+                {**_STYLES["matrixStack"], "opacity": 0.5},
+                _STYLES["matrixStack"],
+            )
+        ],
+    )
+    if not background:
+        app.callback(*outputs, *inputs)(_render)
+        return
+
+    job = {"type": "fullrank-job", "uid": MATCH}
+    app.callback(
+        *outputs,
+        Output(job, "data"),
+        *inputs,
+        State(job, "data"),
+    )(_render_or_defer)
+    app.callback(
+        *[
+            Output(o.component_id, o.component_property, allow_duplicate=True)
+            for o in outputs
+        ],
+        Input(job, "data"),
+        prevent_initial_call=True,
+        **background,
+    )(_render_job)
 
 
 def make_full_rank_component(app, uid: str = "fullrank"):
     """Return a Dash layout that explores full column rank in linear regression."""
 
-    debug = False  # Toggle to True for console diagnostics.
-
-    rng = np.random.default_rng(2024)
-
-    styles: Dict[str, Dict[str, str]] = {
-        "wrap": {
-            "maxWidth": "980px",
-            "margin": "1.5rem auto",
-            "fontFamily": "system-ui, Arial, sans-serif",
-            "color": "#202124",
-        },
-        "introTitle": {"fontSize": "22px", "fontWeight": 700, "marginBottom": "0.5rem"},
-        "introText": {"fontSize": "15px", "lineHeight": "1.6", "marginBottom": "1rem"},
-        "controls": {
-            "display": "grid",
-            "gridTemplateColumns": "repeat(auto-fit, minmax(240px, 1fr))",
-            "gap": "1rem",
-            "alignItems": "center",
-            "marginBottom": "1rem",
-        },
-        "sliderLabel": {"fontWeight": 600, "marginBottom": "0.25rem"},
-        "warning": {
-            "backgroundColor": "#fdecea",
-            "border": "1px solid #f5c6c1",
-            "color": "#b71c1c",
-            "padding": "0.75rem 1rem",
-            "borderRadius": "8px",
-            "fontWeight": 600,
-            "marginBottom": "1rem",
-            "display": "none",
-        },
-        "warningActive": {
-            "backgroundColor": "#fdecea",
-            "border": "1px solid #f5c6c1",
-            "color": "#b71c1c",
-            "padding": "0.75rem 1rem",
-            "borderRadius": "8px",
-            "fontWeight": 600,
-            "marginBottom": "1rem",
-            "display": "block",
-        },
-        "summary": {
-            "backgroundColor": "#f5f7fb",
-            "borderRadius": "8px",
-            "padding": "0.75rem 1rem",
-            "marginBottom": "1rem",
-            "fontSize": "14px",
-            "lineHeight": "1.6",
-        },
-        "matrixStack": {
-            "display": "flex",
-            "flexDirection": "column",
-            "gap": "1.25rem",
-        },
-        "panel": {
-            "backgroundColor": "#ffffff",
-            "border": "1px solid #e2e5ed",
-            "borderRadius": "10px",
-            "padding": "1rem",
-            "boxShadow": "0 4px 10px rgba(15, 35, 95, 0.04)",
-        },
-        "panelTitle": {
-            "fontSize": "16px",
-            "fontWeight": 700,
-            "marginBottom": "0.75rem",
-        },
-        "matrixText": {
-            "fontFamily": "Menlo, Consolas, monospace",
-            "fontSize": "12px",
-            "whiteSpace": "pre",
-            "overflowX": "auto",
-            "overflowY": "auto",
-            "maxHeight": "320px",
-            "backgroundColor": "#fafcff",
-            "padding": "0.75rem",
-            "borderRadius": "8px",
-            "border": "1px solid #e2e5ed",
-        },
-        "inverseMessage": {"color": "#6b7280", "fontStyle": "italic"},
-    }
-
-    presets = {
-        "normal": (100, 5),
-        "near": (40, 8),
-        "square": (10, 10),
-        "wide": (6, 10),
-    }
-
-    def _matrix_block(
-        mat: np.ndarray,
-        *,
-        precision: int = 3,
-        suppress: bool = True,
-        floatmode: str = "maxprec_equal",
-    ) -> html.Pre:
-        with np.printoptions(
-            precision=precision, suppress=suppress, floatmode=floatmode
-        ):
-            rendered = np.array2string(mat, separator=", ")
-        return html.Pre(rendered, style=styles["matrixText"])
+    register_full_rank_callbacks(app)
 
     container = html.Div(
         id={"type": "fullrank-wrap", "uid": uid},
-        style=styles["wrap"],
+        style=_STYLES["wrap"],
         children=[
             html.H2(
                 "Why Full Column Rank Keeps Ordinary Least Squares on Solid Ground",
-                style=styles["introTitle"],
+                style=_STYLES["introTitle"],
             ),
             html.P(
                 (
@@ -127,14 +449,14 @@ def make_full_rank_component(app, uid: str = "fullrank"):
                     "rank of the design matrix X affects the invertibility of XᵀX and "
                     "our ability to compute the OLS solution."
                 ),
-                style=styles["introText"],
+                style=_STYLES["introText"],
             ),
             html.Div(
-                style=styles["controls"],
+                style=_STYLES["controls"],
                 children=[
                     html.Div(
                         children=[
-                            html.Div("Scenario presets", style=styles["sliderLabel"]),
+                            html.Div("Scenario presets", style=_STYLES["sliderLabel"]),
                             dcc.Dropdown(
                                 id={"type": "fullrank-preset", "uid": uid},
                                 options=[
@@ -154,6 +476,14 @@ def make_full_rank_component(app, uid: str = "fullrank"):
                                         "label": "p >> n",
                                         "value": "wide",
                                     },
+                                    {
+                                        "label": "Large design (n = 2000, p = 400)",
+                                        "value": "large",
+                                    },
+                                    {
+                                        "label": "Large wide design (n = 500, p = 2000)",
+                                        "value": "wide_large",
+                                    },
                                 ],
                                 placeholder="Select a preset...",
                                 clearable=True,
@@ -164,12 +494,12 @@ def make_full_rank_component(app, uid: str = "fullrank"):
                         children=[
                             html.Div(
                                 "Number of observations (n)",
-                                style=styles["sliderLabel"],
+                                style=_STYLES["sliderLabel"],
                             ),
                             dcc.Slider(
                                 id={"type": "fullrank-n", "uid": uid},
                                 min=2,
-                                max=100,
+                                max=_MAX_N,
                                 step=1,
                                 value=100,
                                 marks=None,
@@ -180,12 +510,12 @@ def make_full_rank_component(app, uid: str = "fullrank"):
                     html.Div(
                         children=[
                             html.Div(
-                                "Number of predictors (p)", style=styles["sliderLabel"]
+                                "Number of predictors (p)", style=_STYLES["sliderLabel"]
                             ),
                             dcc.Slider(
                                 id={"type": "fullrank-p", "uid": uid},
                                 min=1,
-                                max=10,
+                                max=_MAX_P,
                                 step=1,
                                 value=5,
                                 tooltip={"always_visible": False},
@@ -214,153 +544,25 @@ def make_full_rank_component(app, uid: str = "fullrank"):
             ),
             html.Div(
                 id={"type": "fullrank-warning", "uid": uid},
-                style=styles["warning"],
+                style=_STYLES["warning"],
             ),
             html.Div(
                 id={"type": "fullrank-summary", "uid": uid},
-                style=styles["summary"],
+                style=_STYLES["summary"],
             ),
             html.Div(
                 id={"type": "fullrank-visuals", "uid": uid},
-                style=styles["matrixStack"],
+                style=_STYLES["matrixStack"],
             ),
             dcc.Store(
                 id={"type": "fullrank-store", "uid": uid},
                 data={"seed": 0},
             ),
+            # (n, p, seed) of a large design waiting for its background job.
+            dcc.Store(id={"type": "fullrank-job", "uid": uid}, data=None),
         ],
     )
 
-    @app.callback(
-        Output({"type": "fullrank-n", "uid": MATCH}, "value"),
-        Output({"type": "fullrank-p", "uid": MATCH}, "value"),
-        Input({"type": "fullrank-preset", "uid": MATCH}, "value"),
-        prevent_initial_call=True,
-    )
-    def _apply_preset(preset_key):
-        if preset_key is None:
-            return no_update, no_update
-        n_val, p_val = presets[preset_key]
-        return n_val, p_val
-
-    @app.callback(
-        Output({"type": "fullrank-store", "uid": MATCH}, "data"),
-        Input({"type": "fullrank-generate", "uid": MATCH}, "n_clicks"),
-        State({"type": "fullrank-store", "uid": MATCH}, "data"),
-        prevent_initial_call=True,
-    )
-    def _update_seed(n_clicks, store_data):
-        if not n_clicks:
-            return store_data
-        next_seed = int(rng.integers(0, 10_000_000))
-        return {"seed": next_seed}
-
-    @app.callback(
-        Output({"type": "fullrank-warning", "uid": MATCH}, "children"),
-        Output({"type": "fullrank-warning", "uid": MATCH}, "style"),
-        Output({"type": "fullrank-summary", "uid": MATCH}, "children"),
-        Output({"type": "fullrank-visuals", "uid": MATCH}, "children"),
-        Input({"type": "fullrank-n", "uid": MATCH}, "value"),
-        Input({"type": "fullrank-p", "uid": MATCH}, "value"),
-        Input({"type": "fullrank-store", "uid": MATCH}, "data"),
-    )
-    def _render(n_val, p_val, store_data):
-        if n_val is None or p_val is None:
-            return no_update, no_update, no_update, no_update
-
-        seed = int(store_data.get("seed", 0)) if store_data else 0
-        local_rng = np.random.default_rng(seed)
-        X = local_rng.integers(-9, 10, size=(n_val, p_val)).astype(float)
-
-        xtx = X.T @ X
-        rank = np.linalg.matrix_rank(X)
-        condition_number = np.linalg.cond(xtx) if p_val > 0 else np.inf
-        is_full_rank = rank == p_val
-        near_singular = condition_number > 1e10
-
-        if debug:
-            print(">>> Checking matrix multiplication")
-            print(f"Seed: {seed}")
-            print(f"X shape: {X.shape}, dtype: {X.dtype}")
-            print(f"XᵀX shape: {xtx.shape}")
-            print("Sample X:\n", X[: min(5, n_val), : min(5, p_val)])
-            print("Sample XᵀX:\n", xtx[: min(5, p_val), : min(5, p_val)])
-
-        xtx_inv: Optional[np.ndarray] = None
-        inverse_message: Optional[str] = None
-        if is_full_rank and not near_singular:
-            try:
-                xtx_inv = np.linalg.inv(xtx)
-                if debug:
-                    identity_check = xtx_inv @ xtx
-                    print("Inverse computed.")
-                    print("Inverse(XᵀX) @ XᵀX ≈ I ? ", np.allclose(identity_check, np.eye(p_val)))
-                    print("Condition number:", condition_number)
-            except np.linalg.LinAlgError:
-                xtx_inv = None
-                inverse_message = "Numerical inversion failed."
-        else:
-            inverse_message = (
-                "XᵀX is singular or ill-conditioned; inverse not available."
-            )
-
-        warning_needed = not is_full_rank or near_singular
-        warning_children = []
-        warning_style = styles["warning"]
-        if warning_needed:
-            warning_children = [
-                "⚠️ Warning: X is not full column rank! (XᵀX is singular or nearly singular)."
-            ]
-            warning_style = styles["warningActive"]
-
-        summary_children = [
-            html.Div(f"n (rows of X): {n_val}"),
-            html.Div(f"p (columns of X): {p_val}"),
-            html.Div(f"rank(X): {rank}"),
-            html.Div(
-                f"Condition number of XᵀX: {'{:.2e}'.format(condition_number)}"
-                if math.isfinite(condition_number)
-                else "Condition number of XᵀX: undefined"
-            ),
-        ]
-        if inverse_message and xtx_inv is None:
-            summary_children.append(html.Div(inverse_message))
-
-        visuals_children: List[html.Div] = []
-
-        def _panel(title: str, body_children):
-            return html.Div(
-                style=styles["panel"],
-                children=[
-                    html.Div(title, style=styles["panelTitle"]),
-                    body_children,
-                ],
-            )
-
-        visuals_children.append(_panel("Design matrix X", _matrix_block(X, precision=0)))
-        visuals_children.append(
-            _panel("Cross-product XᵀX", _matrix_block(xtx, precision=2))
-        )
-        if xtx_inv is not None:
-            visuals_children.append(
-                _panel(
-                    "Inverse (XᵀX)⁻¹",
-                    _matrix_block(xtx_inv, precision=6, suppress=False),
-                )
-            )
-        else:
-            visuals_children.append(
-                _panel(
-                    "Inverse (XᵀX)⁻¹",
-                    html.Div(
-                        inverse_message or "Inverse not available.",
-                        style=styles["inverseMessage"],
-                    ),
-                )
-            )
-
-        return warning_children, warning_style, summary_children, visuals_children
-
     return container
 
 
@@ -376,16 +578,16 @@ def _diagnostic_suite():
         print("X:\n", X)
         print("XᵀX:\n", XTX)
         print("np.allclose(XᵀX, X.T @ X)?", np.allclose(XTX, X.T @ X))
-        det = np.linalg.det(XTX)
-        cond = np.linalg.cond(XTX)
-        print(f"det(XᵀX) = {det:.6f}")
-        print(f"cond(XᵀX) = {cond:.6f}")
-        try:
-            inv = np.linalg.inv(XTX)
+        diagnostics = diagnose_design(X)
+        print(f"rank(X) = {diagnostics.rank}")
+        print(f"det(XᵀX) = {diagnostics.determinant:.6f}")
+        print(f"cond(XᵀX) = {diagnostics.condition_number:.6f}")
+        inv = diagnostics.xtx_inv
+        if inv is not None:
             print("(XᵀX)⁻¹:\n", inv)
             identity_check = XTX @ inv
             print("np.allclose((XᵀX) @ (XᵀX)⁻¹, I)?", np.allclose(identity_check, np.eye(XTX.shape[0])))
-        except np.linalg.LinAlgError:
+        else:
             print("Matrix is singular; inverse does not exist.")
 
 
@@ -0,0 +1,76 @@
+"""Development-only hot reload for the Markdown sections under ``notes/``."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+from components.utils import load_markdown
+
+
+class MarkdownWatcher:
+    """Keep Markdown files in memory and bump a per-file version when they change.
+
+    A daemon thread polls the files' mtimes, so callbacks asking "what changed?"
+    never touch the disk themselves.
+    """
+
+    def __init__(self, notes_dir: Path, filenames: Iterable[str], interval: float = 1.0):
+        self.notes_dir = notes_dir
+        self.filenames = list(filenames)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        # filename -> (mtime_ns, version, text)
+        self._sections: Dict[str, Tuple[int, int, str]] = {}
+        self.poll()
+
+    def poll(self) -> None:
+        """Re-read any file whose mtime changed since the last poll."""
+        for filename in self.filenames:
+            path = self.notes_dir / filename
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            current = self._sections.get(filename)
+            if current is not None and current[0] == mtime:
+                continue
+            text = load_markdown(path)
+            version = current[1] + 1 if current is not None else 0
+            with self._lock:
+                self._sections[filename] = (mtime, version, text)
+
+    def start(self) -> "MarkdownWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="markdown-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def text(self, filename: str) -> str:
+        with self._lock:
+            return self._sections[filename][2]
+
+    def versions(self) -> Dict[str, int]:
+        with self._lock:
+            return {name: entry[1] for name, entry in self._sections.items()}
+
+    def changed_since(self, known: Dict[str, int]) -> Dict[str, str]:
+        """Return ``{filename: text}`` for sections newer than ``known``."""
+        with self._lock:
+            return {
+                name: text
+                for name, (_, version, text) in self._sections.items()
+                if known.get(name) != version
+            }
@@ -0,0 +1,90 @@
+"""Serve Dash's layout and callback list from a precomputed snapshot with ETags.
+
+With a static ``app.layout`` both ``/_dash-layout`` and ``/_dash-dependencies``
+return the same bytes to every visitor, yet Dash re-serializes them on each
+request. ``serve_snapshots(app)`` serializes each once (through Dash's own view,
+so hooks and encoders still apply), hashes it into a strong ETag, and answers
+``If-None-Match`` revalidations with an empty 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Callable, Dict, NamedTuple, Optional
+
+import flask
+
+_ENDPOINTS = ("_dash-layout", "_dash-dependencies")
+
+
+class _Snapshot(NamedTuple):
+    body: bytes
+    etag: str
+    mimetype: str
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        # Drop the weak prefix, quotes and the ":gzip"/":br" suffix that
+        # flask-compress appends to strong ETags of compressed responses.
+        tag = tag.removeprefix("W/").strip('"').split(":", 1)[0]
+        if tag == etag:
+            return True
+    return False
+
+
+def serve_snapshots(app, *, max_age: int = 0) -> Callable[[], None]:
+    """Cache the layout and dependency responses of ``app``.
+
+    ``max_age=0`` (the default) sends ``Cache-Control: no-cache``: browsers and
+    proxies keep the body but revalidate every time, which costs a 304. A
+    positive ``max_age`` lets them skip the request for that many seconds.
+
+    Returns a function that drops the snapshots, for when the layout or the
+    callbacks change at runtime.
+    """
+
+    snapshots: Dict[str, _Snapshot] = {}
+    lock = threading.Lock()
+    server = app.server
+    prefix = app.config.routes_pathname_prefix
+    paths = {f"{prefix}{name}" for name in _ENDPOINTS}
+    cache_control = "no-cache" if max_age <= 0 else f"public, max-age={max_age}"
+
+    def _snapshot(path: str) -> _Snapshot:
+        snapshot = snapshots.get(path)
+        if snapshot is None:
+            with lock:
+                snapshot = snapshots.get(path)
+                if snapshot is None:
+                    response = server.view_functions[flask.request.endpoint]()
+                    body = response.get_data()
+                    snapshot = snapshots[path] = _Snapshot(
+                        body, hashlib.sha256(body).hexdigest()[:32], response.mimetype
+                    )
+        return snapshot
+
+    @server.before_request
+    def _serve_snapshot():
+        path = flask.request.path
+        if path not in paths or flask.request.method not in ("GET", "HEAD"):
+            return None
+        if path.endswith("_dash-layout") and callable(app.layout):
+            return None  # Built per request; nothing to share.
+
+        snapshot = _snapshot(path)
+        if _etag_matches(flask.request.headers.get("If-None-Match"), snapshot.etag):
+            response = flask.Response(status=304)
+        else:
+            response = flask.Response(snapshot.body, mimetype=snapshot.mimetype)
+        response.set_etag(snapshot.etag)
+        response.headers["Cache-Control"] = cache_control
+        return response
+
+    return snapshots.clear
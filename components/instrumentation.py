@@ -0,0 +1,170 @@
+"""Per-callback timing, payload and cache metrics for a Dash app.
+
+``instrument(app)`` must run before any component registers its callbacks. It
+wraps every function registered through ``app.callback`` with a timer, hooks
+the ``_dash-update-component`` endpoint to count request/response bytes, and
+serves the totals at ``/metrics`` (Prometheus text, or JSON with
+``?format=json``). Metrics are per process.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict
+
+import flask
+from dash.exceptions import PreventUpdate
+
+_FIELDS = (
+    "calls",
+    "errors",
+    "func_seconds_total",
+    "func_seconds_max",
+    "request_seconds_total",
+    "bytes_in_total",
+    "bytes_out_total",
+)
+
+
+def callback_name(func: Callable) -> str:
+    """Module-qualified name: every demo module has its own ``_update``."""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+class CallbackMetrics:
+    """Thread-safe accumulator of per-callback counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(_FIELDS, 0)
+        )
+        self._caches: Dict[str, Callable[[], object]] = {}
+
+    def add(self, name: str, **values: float) -> None:
+        with self._lock:
+            stats = self._stats[name]
+            for key, value in values.items():
+                if key.endswith("_max"):
+                    stats[key] = max(stats[key], value)
+                else:
+                    stats[key] += value
+
+    def register_cache(self, name: str, cache_info: Callable[[], object]) -> None:
+        """Report hits/misses of ``cache_info()`` (an ``lru_cache``-style callable)."""
+        self._caches[name] = cache_info
+
+    def timed(self, func: Callable) -> Callable:
+        name = callback_name(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as err:
+                # PreventUpdate is flow control, not a failure.
+                if not isinstance(err, PreventUpdate):
+                    self.add(name, errors=1)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                self.add(
+                    name,
+                    calls=1,
+                    func_seconds_total=elapsed,
+                    func_seconds_max=elapsed,
+                )
+                if flask.has_request_context():
+                    flask.g.callback_timing = (name, elapsed)
+
+        return wrapper
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            callbacks = {name: dict(stats) for name, stats in self._stats.items()}
+        caches = {}
+        for name, cache_info in self._caches.items():
+            info = cache_info()
+            lookups = info.hits + info.misses
+            caches[name] = {
+                "hits": info.hits,
+                "misses": info.misses,
+                "size": info.currsize,
+                "hit_rate": info.hits / lookups if lookups else None,
+            }
+        return {"callbacks": callbacks, "caches": caches}
+
+    def prometheus(self) -> str:
+        snap = self.snapshot()
+        lines = []
+        for field in _FIELDS:
+            metric = f"dash_callback_{field}"
+            lines.append(f"# TYPE {metric} {'gauge' if field.endswith('_max') else 'counter'}")
+            for name, stats in sorted(snap["callbacks"].items()):
+                lines.append(f'{metric}{{callback="{name}"}} {stats[field]}')
+        for field in ("hits", "misses", "size"):
+            metric = f"dash_cache_{field}"
+            lines.append(f"# TYPE {metric} {'gauge' if field == 'size' else 'counter'}")
+            for name, stats in sorted(snap["caches"].items()):
+                lines.append(f'{metric}{{cache="{name}"}} {stats[field]}')
+        return "\n".join(lines) + "\n"
+
+
+def instrument(
+    app, *, endpoint: str = "/metrics", server_timing: bool = True
+) -> CallbackMetrics:
+    """Attach callback metrics to ``app`` and return the collector."""
+
+    metrics = CallbackMetrics()
+    register = app.callback
+
+    @functools.wraps(register)
+    def callback(*args, **kwargs):
+        decorator = register(*args, **kwargs)
+        return lambda func: decorator(metrics.timed(func))
+
+    app.callback = callback
+    server = app.server
+
+    def _callback_name(output: str) -> str:
+        entry = app.callback_map.get(output)
+        func = entry and entry.get("callback")
+        return callback_name(func) if func is not None else output
+
+    @server.before_request
+    def _start_timer():
+        flask.g.request_start = time.perf_counter()
+
+    @server.after_request
+    def _record_request(response):
+        if not flask.request.path.endswith("_dash-update-component"):
+            return response
+        payload = flask.request.get_json(silent=True) or {}
+        name = _callback_name(payload.get("output", "?"))
+        elapsed = time.perf_counter() - flask.g.get("request_start", time.perf_counter())
+        metrics.add(
+            name,
+            request_seconds_total=elapsed,
+            bytes_in_total=flask.request.content_length or 0,
+            bytes_out_total=response.calculate_content_length() or 0,
+        )
+        if server_timing:
+            entries = [f"total;dur={elapsed * 1e3:.2f}"]
+            timing = flask.g.get("callback_timing")
+            if timing is not None:
+                entries.insert(0, f'callback;dur={timing[1] * 1e3:.2f};desc="{timing[0]}"')
+            response.headers["Server-Timing"] = ", ".join(entries)
+        return response
+
+    def _metrics_view():
+        if flask.request.args.get("format") == "json":
+            return flask.Response(json.dumps(metrics.snapshot()), mimetype="application/json")
+        return flask.Response(metrics.prometheus(), mimetype="text/plain; version=0.0.4")
+
+    server.add_url_rule(endpoint, "callback_metrics", _metrics_view)
+    return metrics
@@ -1,26 +1,38 @@
-"""Interactive visualization exploring the bias-variance trade-off."""
+"""Interactive visualization exploring the bias-variance trade-off.
+
+``interactive_layout`` is built on first access (PEP 562), so importing this
+module does not load plotly.express or its sample data.
+"""
 
 from dash import dcc, html
-import plotly.express as px
 
-# Precompute figure to avoid recalculation on every layout render.
-_bias_variance_fig = px.line(
-    px.data.tips(),
-    x="total_bill",
-    y="tip",
-    color="sex",
-    title="OLS Fit Sensitivity Example",
-)
 
-interactive_layout = html.Section(
-    style={"marginTop": "40px"},
-    children=[
-        html.H2("Interactive Example: Sensitivity in OLS"),
-        html.P(
-            "Explore how the fitted regression line changes across subgroups. "
-            "Hover to inspect individual observations."
-        ),
-        dcc.Graph(figure=_bias_variance_fig, config={"displayModeBar": False}),
-    ],
-)
+def make_interactive_layout():
+    import plotly.express as px
+
+    bias_variance_fig = px.line(
+        px.data.tips(),
+        x="total_bill",
+        y="tip",
+        color="sex",
+        title="OLS Fit Sensitivity Example",
+    )
+    return html.Section(
+        style={"marginTop": "40px"},
+        children=[
+            html.H2("Interactive Example: Sensitivity in OLS"),
+            html.P(
+                "Explore how the fitted regression line changes across subgroups. "
+                "Hover to inspect individual observations."
+            ),
+            dcc.Graph(figure=bias_variance_fig, config={"displayModeBar": False}),
+        ],
+    )
+
 
+def __getattr__(name):
+    if name == "interactive_layout":
+        # Cached as a real module attribute; later lookups skip this hook.
+        value = globals()[name] = make_interactive_layout()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,33 +1,80 @@
 # lasso_component.py
+import json
+import math
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
-from dash import MATCH, Input, Output, dcc, html
-from sklearn.linear_model import Lasso
-from sklearn.metrics import r2_score
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
+import plotly.graph_objects as go
+from dash import MATCH, ClientsideFunction, Input, Output, State, dcc, html
+from dash.exceptions import PreventUpdate
+from plotly.io.json import to_json_plotly
+
+from components.artifact_cache import cached_arrays
+from components.background import background_options
+from components.cv import CVResult, kfold_lasso_cv
+from components.datasets import sparse_regression
+from components.figures import compact_figure
+from components.path_engine import screened_lasso_path
+from components.utils import register_once
+
+ALPHAS = (0.0001, 0.001, 0.01, 0.1, 1, 10)
+_MAX_SLIDER_MARKS = 8
+_TRUE_SUPPORT = (19, 39, 59, 79, 99, 98)
+
+# Refit slider ranges; p starts at 100 so the true support always fits.
+_N_RANGE = (20, 500, 10)
+_P_RANGE = (100, 3000, 50)
+_SNR_RANGE = (0.5, 20.0, 0.5)
+
+# Cross-validation: K folds over a log grid spanning the demo's alphas.
+_CV_FOLDS = 5
+_CV_GRID_SIZE = 40
+
+# Alpha grid of every component built in this process, by uid. Callbacks look
+# the grid up here; the browser-side params Store only names the uid.
+_ALPHA_GRIDS = {}
+
+STYLES = {
+    "wrap": {
+        "maxWidth": "980px",
+        "margin": "1rem auto",
+        "fontFamily": "system-ui, Arial, sans-serif",
+    },
+    "title": {"margin": "0 0 0.25rem 0", "fontSize": "20px", "fontWeight": 700},
+    "subtitle": {"color": "#555", "marginBottom": "0.75rem", "fontSize": "14px"},
+    "metrics": {"marginTop": "0.5rem", "fontSize": "14px", "color": "#333"},
+    "equation": {
+        "fontSize": "20px",
+        "lineHeight": "1.7",
+        "overflowWrap": "anywhere",
+    },
+    "plus": {"fontWeight": 400, "padding": "0 0.25rem"},
+    "termBold": {"fontWeight": 700},
+    "termRed": {"fontWeight": 700, "color": "#c62828"},
+    "controls": {
+        "display": "grid",
+        "gridTemplateColumns": "repeat(auto-fit, minmax(220px, 1fr))",
+        "gap": "0.75rem 1.5rem",
+        "margin": "0.5rem 0 1rem 0",
+    },
+    "sliderLabel": {"fontSize": "14px", "fontWeight": 600, "marginBottom": "0.25rem"},
+}
+
 
+def _train_test(n, p, snr):
+    from sklearn.model_selection import train_test_split
 
-def make_lasso_component(app, uid="lasso", *, n=50, p=150):
-    """Return a self-contained Dash LASSO equation component."""
+    data = sparse_regression(n, p, seed=0, support=_TRUE_SUPPORT, snr=snr)
+    return data, train_test_split(data.X, data.y, test_size=0.2, random_state=47)
 
+
+def _compute_lasso_grid(n, p, alphas, snr=5.0):
     # ---------------------------
     # 1) Create synthetic data
     # ---------------------------
-    rng = np.random.default_rng(0)
-    X_raw = rng.normal(size=(n, p))
-
-    beta_true = np.zeros(p)
-    beta_true[[19, 39, 59, 79, 99, 98]] = [0.25, -0.75, 1.0, -3.5, 4.0, -6.0]
+    from sklearn.preprocessing import StandardScaler
 
-    signal = X_raw @ beta_true
-    sigma = np.std(signal) / np.sqrt(5.0)
-    noise = rng.normal(scale=sigma, size=n)
-    y_raw = signal + noise
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_raw, y_raw, test_size=0.2, random_state=47
-    )
+    data, (X_train, X_test, y_train, y_test) = _train_test(n, p, snr)
 
     scaler = StandardScaler().fit(X_train)
     X_train = scaler.transform(X_train)
@@ -36,98 +83,478 @@ def make_lasso_component(app, uid="lasso", *, n=50, p=150):
     # ---------------------------
     # 2) Precompute LASSO fits
     # ---------------------------
-    alphas = [0.0001, 0.001, 0.01, 0.1, 1, 10]
-    coefs = np.zeros((len(alphas), X_raw.shape[1]))
-    intercepts = np.zeros(len(alphas))
-    r2s = np.zeros(len(alphas))
+    # One warm-started, screened path solve over the grid (largest alpha first)
+    # instead of independent cold fits. X_train is standardized, so only y needs
+    # centering.
+    y_mean = y_train.mean()
+    coefs = screened_lasso_path(X_train, y_train - y_mean, alphas, max_iter=20000)
+    intercepts = y_mean - coefs @ X_train.mean(axis=0)
 
-    for i, a in enumerate(alphas):
-        m = Lasso(alpha=a, max_iter=20000, random_state=0)
-        m.fit(X_train, y_train)
-        coefs[i] = m.coef_
-        intercepts[i] = m.intercept_
-        r2s[i] = r2_score(y_test, m.predict(X_test))
+    # Test R² for the whole grid from one matrix product.
+    preds = X_test @ coefs.T + intercepts
+    ss_res = ((y_test[:, None] - preds) ** 2).sum(axis=0)
+    ss_tot = ((y_test - y_test.mean()) ** 2).sum()
+    r2s = 1.0 - ss_res / ss_tot
 
-    true_set = {j + 1 for j in np.flatnonzero(beta_true)}  # highlight these
+    return {
+        "coefs": coefs,
+        "intercepts": intercepts,
+        "r2s": r2s,
+        "support": data.support,
+    }
 
-    # ---------------------------
-    # 3) Styles (local)
-    # ---------------------------
-    styles = {
-        "wrap": {
-            "maxWidth": "980px",
-            "margin": "1rem auto",
-            "fontFamily": "system-ui, Arial, sans-serif",
+
+@lru_cache(maxsize=64)
+def _fit_lasso_grid(n, p, alphas, snr=5.0):
+    """Fit one LASSO per alpha on the synthetic demo data.
+
+    Results are memoized per process by ``(n, p, alphas, snr)`` and persisted in
+    the on-disk artifact cache, so refits users already asked for, warm restarts
+    and additional workers load the arrays instead of refitting.
+    """
+
+    arrays = cached_arrays(
+        "lasso-grid",
+        {
+            "n": n,
+            "p": p,
+            "alphas": alphas,
+            "snr": snr,
+            "seed": 0,
+            "solver": "screened_cd",
         },
-        "title": {"margin": "0 0 0.25rem 0", "fontSize": "20px", "fontWeight": 700},
-        "subtitle": {"color": "#555", "marginBottom": "0.75rem", "fontSize": "14px"},
-        "metrics": {"marginTop": "0.5rem", "fontSize": "14px", "color": "#333"},
-        "equation": {
-            "fontSize": "20px",
-            "lineHeight": "1.7",
-            "overflowWrap": "anywhere",
+        lambda: _compute_lasso_grid(n, p, alphas, snr),
+    )
+    true_set = frozenset(int(j) + 1 for j in arrays["support"])  # highlight these
+    return arrays["coefs"], arrays["intercepts"], arrays["r2s"], true_set
+
+
+def _cv_alphas(alphas):
+    return tuple(np.geomspace(min(alphas), max(alphas), _CV_GRID_SIZE).tolist())
+
+
+@lru_cache(maxsize=64)
+def _fit_lasso_cv(n, p, alphas, snr=5.0):
+    """K-fold CV error curve over ``_cv_alphas(alphas)`` on the training split.
+
+    The held-out test rows stay out of it, so the test R² shown next to the
+    equation is still an honest check of the CV choice. Cached like the fits.
+    """
+
+    cv_alphas = _cv_alphas(alphas)
+
+    def _compute():
+        _, (X_train, _, y_train, _) = _train_test(n, p, snr)
+        result = kfold_lasso_cv(X_train, y_train, cv_alphas, k=_CV_FOLDS, max_iter=20000)
+        return {"fold_mse": result.fold_mse}
+
+    arrays = cached_arrays(
+        "lasso-cv",
+        {
+            "n": n,
+            "p": p,
+            "alphas": cv_alphas,
+            "snr": snr,
+            "seed": 0,
+            "k": _CV_FOLDS,
+            "cv_seed": 0,
+            "solver": "screened_cd",
         },
-        "plus": {"fontWeight": 400, "padding": "0 0.25rem"},
-        "termBold": {"fontWeight": 700},
-        "termRed": {"fontWeight": 700, "color": "#c62828"},
+        _compute,
+    )
+    return CVResult(np.asarray(cv_alphas), arrays["fold_mse"])
+
+
+def _cv_figure(n, p, alphas, snr=5.0, digits=None):
+    cv = _fit_lasso_cv(n, p, alphas, snr)
+    mean, se = cv.mean_mse, cv.se_mse
+    fig = go.Figure(
+        [
+            go.Scatter(
+                x=cv.alphas,
+                y=mean + se,
+                mode="lines",
+                line={"width": 0},
+                hoverinfo="skip",
+                showlegend=False,
+            ),
+            go.Scatter(
+                x=cv.alphas,
+                y=mean - se,
+                mode="lines",
+                line={"width": 0},
+                fill="tonexty",
+                fillcolor="rgba(31, 119, 180, 0.2)",
+                name="± 1 SE",
+                hoverinfo="skip",
+            ),
+            go.Scatter(
+                x=cv.alphas,
+                y=mean,
+                mode="lines+markers",
+                name="mean CV MSE",
+                line={"color": "#1f77b4"},
+                marker={"size": 5},
+            ),
+        ]
+    )
+    # Shapes on a log axis are positioned in log10 units.
+    fig.add_vline(x=np.log10(cv.alpha_min), line_dash="dot", line_color="#555")
+    fig.add_vline(x=np.log10(cv.alpha_1se), line_dash="dash", line_color="#c62828")
+    fig.update_layout(
+        title=(
+            f"{_CV_FOLDS}-fold CV error: minimum at α = {cv.alpha_min:.3g}, "
+            f"1-SE choice α = {cv.alpha_1se:.3g}"
+        ),
+        xaxis={"title": "α", "type": "log"},
+        yaxis={"title": "held-out MSE"},
+        height=320,
+        margin={"l": 60, "r": 20, "t": 50, "b": 50},
+        template="plotly_white",
+        legend={"orientation": "h", "y": -0.25},
+    )
+    if digits is not None:
+        compact_figure(fig, digits)
+    return fig
+
+
+# ---------------------------
+# Equation rendering
+# ---------------------------
+def _beta_x_term(j1: int, is_true: bool):
+    st = STYLES["termRed"] if is_true else STYLES["termBold"]
+    return html.Span(
+        [
+            html.Span("β", style={"fontStyle": "italic"}),
+            html.Sub(str(j1)),
+            html.Span("("),
+            html.Span("x", style={"fontStyle": "italic"}),
+            html.Sub(str(j1)),
+            html.Span(")"),
+        ],
+        style=st,
+    )
+
+
+def _equation_children(w, true_set, wrap_every: int = 8):
+    nz = np.flatnonzero(w != 0.0)
+    parts = []
+    parts.append(html.Span("ŷ = ", style={"fontWeight": 700}))
+    parts.extend(
+        [
+            html.Span("β", style={"fontStyle": "italic", "fontWeight": 700}),
+            html.Sub("0"),
+        ]
+    )
+    if nz.size:
+        parts.append(html.Span("+", style=STYLES["plus"]))
+        line_terms, count = [], 0
+        for j in nz:
+            j1 = j + 1
+            line_terms.append(_beta_x_term(j1, j1 in true_set))
+            count += 1
+            if count < len(nz) and (count % wrap_every) != 0:
+                line_terms.append(html.Span("+", style=STYLES["plus"]))
+            if count % wrap_every == 0 and count < len(nz):
+                parts.extend(line_terms)
+                parts.append(html.Br())
+                line_terms = []
+        parts.extend(line_terms)
+    else:
+        parts.append(
+            html.Span(" (no predictors selected)", style={"color": "#665"})
+        )
+    return parts
+
+
+# ---------------------------
+# Callback (scoped)
+# ---------------------------
+@lru_cache(maxsize=512)
+def _equation_payload(n, p, alphas, alpha_idx, snr=5.0):
+    """Equation children and metrics text for one alpha, memoized per process.
+
+    The children are kept in serialized (plain JSON) form: Dash encodes plain
+    lists and dicts far faster than a tree of html components.
+    """
+    coefs, _, r2s, true_set = _fit_lasso_grid(n, p, alphas, snr)
+    eq = json.loads(to_json_plotly(_equation_children(coefs[alpha_idx], true_set)))
+    selected = int(np.sum(coefs[alpha_idx] != 0.0))
+    r2 = r2s[alpha_idx]
+    a = alphas[alpha_idx]
+    metrics = f"α = {a:g} | selected predictors = {selected} | Test R² = {r2:.3f}"
+    return eq, metrics
+
+
+def fit_cache_info():
+    """Hit/miss counters for the per-process LASSO fit cache."""
+    return _fit_lasso_grid.cache_info()
+
+
+def cv_cache_info():
+    """Hit/miss counters for the per-process cross-validation cache."""
+    return _fit_lasso_cv.cache_info()
+
+
+def equation_cache_info():
+    """Hit/miss counters for the memoized equation payloads."""
+    return _equation_payload.cache_info()
+
+
+def _in_range(value, value_range):
+    low, high, _ = value_range
+    return low <= value <= high
+
+
+def _server_params(params, n=None, p=None, snr=None):
+    """``(n, p, alphas, snr)`` for a callback, checked before anything is fitted.
+
+    The params Store and the sliders live in the browser, so values outside the
+    slider ranges raise ``PreventUpdate`` instead of starting an arbitrary fit.
+    Alphas come from ``_ALPHA_GRIDS``; a process that has not built the
+    component yet uses ``ALPHAS``, the grid every demo in main.py uses.
+    """
+
+    params = params if isinstance(params, dict) else {}
+    try:
+        n = int(params.get("n") if n is None else n)
+        p = int(params.get("p") if p is None else p)
+        snr = float(params.get("snr", 5.0) if snr is None else snr)
+    except (TypeError, ValueError, OverflowError):
+        raise PreventUpdate
+    if not (_in_range(n, _N_RANGE) and _in_range(p, _P_RANGE) and _in_range(snr, _SNR_RANGE)):
+        raise PreventUpdate
+    return n, p, _ALPHA_GRIDS.get(params.get("uid"), ALPHAS), snr
+
+
+def _figure_digits(params):
+    digits = params.get("figure_digits") if isinstance(params, dict) else None
+    if digits is None:
+        return None
+    if not isinstance(digits, int) or not 1 <= digits <= 15:
+        raise PreventUpdate
+    return digits
+
+
+def _update(alpha_idx, params):
+    n, p, alphas, snr = _server_params(params)
+    if not isinstance(alpha_idx, int) or not 0 <= alpha_idx < len(alphas):
+        raise PreventUpdate
+    return _equation_payload(n, p, alphas, alpha_idx, snr)
+
+
+def _clientside_payload(n, p, alphas, snr=5.0):
+    """Everything assets/lasso.js needs to render the equation without the server."""
+    coefs, _, r2s, true_set = _fit_lasso_grid(n, p, alphas, snr)
+    return {
+        "labels": [f"{a:g}" for a in alphas],
+        "r2s": [float(r) for r in r2s],
+        "support": [(np.flatnonzero(w != 0.0) + 1).tolist() for w in coefs],
+        "truth": sorted(true_set),
+        "styles": {k: STYLES[k] for k in ("plus", "termBold", "termRed")},
     }
 
-    marks = {i: f"{a:g}" for i, a in enumerate(alphas)}
 
-    # ---------------------------
-    # 4) Equation rendering
-    # ---------------------------
-    def _beta_x_term(j1: int, is_true: bool):
-        st = styles["termRed"] if is_true else styles["termBold"]
-        return html.Span(
+def _refit(n, p, snr, params):
+    if n is None or p is None or snr is None:
+        raise PreventUpdate
+    n, p, alphas, snr = _server_params(params, n, p, snr)
+    digits = _figure_digits(params)
+    # Fit here so the equation callback that follows is a cache lookup.
+    _fit_lasso_grid(n, p, alphas, snr)
+    return {**params, "n": n, "p": p, "snr": snr}, _cv_figure(n, p, alphas, snr, digits)
+
+
+def _refit_clientside(n, p, snr, params):
+    if n is None or p is None or snr is None:
+        raise PreventUpdate
+    n, p, alphas, snr = _server_params(params, n, p, snr)
+    digits = _figure_digits(params)
+    payload = _clientside_payload(n, p, alphas, snr)
+    return {**params, "n": n, "p": p, "snr": snr}, payload, _cv_figure(n, p, alphas, snr, digits)
+
+
+def register_lasso_callbacks(app):
+    """Register the pattern-matching callbacks shared by every LASSO demo."""
+
+    if not register_once(app, "lasso"):
+        return
+
+    # Clientside mode: the browser renders from the precomputed payload.
+    app.clientside_callback(
+        ClientsideFunction(namespace="lasso", function_name="renderEquation"),
+        Output({"type": "lasso-cs-equation", "uid": MATCH}, "children"),
+        Output({"type": "lasso-cs-metrics", "uid": MATCH}, "children"),
+        Input({"type": "lasso-cs-alpha", "uid": MATCH}, "value"),
+        Input({"type": "lasso-cs-data", "uid": MATCH}, "data"),
+    )
+
+    app.callback(
+        Output({"type": "lasso-equation", "uid": MATCH}, "children"),
+        Output({"type": "lasso-metrics", "uid": MATCH}, "children"),
+        Input({"type": "lasso-alpha", "uid": MATCH}, "value"),
+        Input({"type": "lasso-params", "uid": MATCH}, "data"),
+        prevent_initial_call=False,
+    )(_update)
+
+    # Refits regenerate the data and solve every alpha; run them off the request
+    # thread when a background manager is available.
+    for prefix, outputs, refit in (
+        (
+            "lasso",
+            [
+                Output({"type": "lasso-params", "uid": MATCH}, "data"),
+                Output({"type": "lasso-cv", "uid": MATCH}, "figure"),
+            ],
+            _refit,
+        ),
+        (
+            "lasso-cs",
             [
-                html.Span("β", style={"fontStyle": "italic"}),
-                html.Sub(str(j1)),
-                html.Span("("),
-                html.Span("x", style={"fontStyle": "italic"}),
-                html.Sub(str(j1)),
-                html.Span(")"),
+                Output({"type": "lasso-cs-params", "uid": MATCH}, "data"),
+                Output({"type": "lasso-cs-data", "uid": MATCH}, "data"),
+                Output({"type": "lasso-cs-cv", "uid": MATCH}, "figure"),
             ],
-            style=st,
+            _refit_clientside,
+        ),
+    ):
+        app.callback(
+            *outputs,
+            Input({"type": f"{prefix}-n", "uid": MATCH}, "value"),
+            Input({"type": f"{prefix}-p", "uid": MATCH}, "value"),
+            Input({"type": f"{prefix}-snr", "uid": MATCH}, "value"),
+            State({"type": f"{prefix}-params", "uid": MATCH}, "data"),
+            prevent_initial_call=True,
+            **background_options(
+                app,
+                running=[
+                    (
+                        Output({"type": f"{prefix}-equation", "uid": MATCH}, "style"),
+                        {**STYLES["equation"], "opacity": 0.5},
+                        STYLES["equation"],
+                    )
+                ],
+            ),
+        )(refit)
+
+
+def _refit_slider(label, slider_id, value, value_range):
+    low, high, step = value_range
+    return html.Div(
+        [
+            html.Div(label, style=STYLES["sliderLabel"]),
+            dcc.Slider(
+                id=slider_id,
+                min=low,
+                max=high,
+                step=step,
+                value=value,
+                marks={low: f"{low:g}", high: f"{high:g}"},
+                tooltip={"placement": "bottom", "always_visible": False},
+            ),
+        ]
+    )
+
+
+def make_lasso_component(
+    app,
+    uid="lasso",
+    *,
+    n=50,
+    p=150,
+    snr=5.0,
+    alphas=ALPHAS,
+    clientside=False,
+    refit=True,
+    figure_digits=None,
+):
+    """Return a self-contained Dash LASSO equation component.
+
+    ``alphas`` may be any grid, including dense log-spaced ones with 100+ values;
+    the whole grid is solved as a single warm-started path.
+
+    Sliders for n, p and the signal-to-noise ratio regenerate the data and refit
+    the whole grid with the screened path engine (``components/path_engine.py``);
+    fits are memoized by ``(n, p, alphas, snr)``. ``refit=False`` leaves them out
+    (refits need the server).
+
+    With ``clientside=True`` the fitted supports and test R² values ship to the
+    browser in a ``dcc.Store`` once, and slider moves are rendered by a clientside
+    callback (``assets/lasso.js``) without any server round-trip.
+
+    Below the equation, a ``_CV_FOLDS``-fold cross-validation curve (mean
+    held-out MSE ± one standard error) marks the error-minimizing alpha and the
+    largest alpha within one SE of it. The folds are solved in parallel
+    (``components/cv.py``) and refit with the other sliders.
+    """
+
+    register_lasso_callbacks(app)
+    prefix = "lasso-cs" if clientside else "lasso"
+
+    alphas = tuple(float(a) for a in alphas)
+    if not (_in_range(n, _N_RANGE) and _in_range(p, _P_RANGE) and _in_range(snr, _SNR_RANGE)):
+        raise ValueError(
+            f"n, p and snr must lie in the slider ranges {_N_RANGE[:2]}, "
+            f"{_P_RANGE[:2]} and {_SNR_RANGE[:2]}"
         )
+    _ALPHA_GRIDS[uid] = alphas
+    # Warm the per-process fit cache so the first callback is a lookup.
+    _fit_lasso_grid(n, p, alphas, snr)
 
-    def _equation_children(idx: int, wrap_every: int = 8):
-        w = coefs[idx]
-        nz = np.flatnonzero(w != 0.0)
-        parts = []
-        parts.append(html.Span("ŷ = ", style={"fontWeight": 700}))
-        parts.extend(
-            [
-                html.Span("β", style={"fontStyle": "italic", "fontWeight": 700}),
-                html.Sub("0"),
-            ]
+    # Dense grids get a continuous index slider with a handful of labelled marks.
+    mark_every = max(1, math.ceil(len(alphas) / _MAX_SLIDER_MARKS))
+    marks = {i: f"{alphas[i]:.3g}" for i in range(0, len(alphas), mark_every)}
+    marks[len(alphas) - 1] = f"{alphas[-1]:.3g}"
+    if len(alphas) > _MAX_SLIDER_MARKS:
+        levels = f"{len(alphas)} values from {min(alphas):g} to {max(alphas):g}"
+    else:
+        levels = ", ".join(f"{a:g}" for a in alphas)
+    # The prose describes the data this instance was built with.
+    true_betas = ", ".join(f"β{j + 1}" for j in sorted(_TRUE_SUPPORT))
+    if p > n:
+        dimension_note = (
+            "This is no doubt a small data set. But, by definition, it is a high "
+            "dimensional one none the less (p > n)."
+        )
+    else:
+        dimension_note = (
+            "With no more parameters than observations, this is a classical, low "
+            "dimensional setting; it becomes high dimensional once p exceeds n."
         )
-        if nz.size:
-            parts.append(html.Span("+", style=styles["plus"]))
-            line_terms, count = [], 0
-            for j in nz:
-                j1 = j + 1
-                line_terms.append(_beta_x_term(j1, j1 in true_set))
-                count += 1
-                if count < len(nz) and (count % wrap_every) != 0:
-                    line_terms.append(html.Span("+", style=styles["plus"]))
-                if count % wrap_every == 0 and count < len(nz):
-                    parts.extend(line_terms)
-                    parts.append(html.Br())
-                    line_terms = []
-            parts.extend(line_terms)
-        else:
-            parts.append(
-                html.Span(" (no predictors selected)", style={"color": "#665"})
+    slider_note = (
+        " The n, p and signal to noise sliders below start from these values and refit everything when moved."
+        if refit
+        else ""
+    )
+
+    # Fit parameters travel with the layout so any worker can serve the
+    # callbacks; the server re-checks them (``_server_params``).
+    stores = [
+        dcc.Store(
+            id={"type": f"{prefix}-params", "uid": uid},
+            data={
+                "uid": uid,
+                "n": n,
+                "p": p,
+                "snr": snr,
+                "figure_digits": figure_digits,
+            },
+        )
+    ]
+    if clientside:
+        stores.append(
+            dcc.Store(
+                id={"type": "lasso-cs-data", "uid": uid},
+                data=_clientside_payload(n, p, alphas, snr),
             )
-        return parts
+        )
 
     # ---------------------------
-    # 5) Component layout
+    # Component layout
     # ---------------------------
     container = html.Div(
         id={"type": "lasso-wrap", "uid": uid},
-        style=styles["wrap"],
+        style=STYLES["wrap"],
         children=[
             html.H1('A "Simple" Demonstration of LASSO Regularization'),
             html.P(
@@ -136,54 +563,72 @@ To get a grasp of how the LASSO regression method handles high dimensional data,
 """
             ),
             html.P(
-                """
-The interactive graph below is based on our data set which we created with Numpy, a python module, and has 150 parameters (p=150) and 50 observations (n=50). This is no doubt a small data set. But, by definition, it is a high dimensional none the less (p >> n). Because the data is synthetic, we had the luxury of making our own true β’s which are located at β20, β40, β60, β80, β99, and β100. We set a signal to noise ratio of 5 to create our X matrix, β Matrix, error matrix and finally our y equation at y = Xβ + ε. 
+                f"""
+The interactive graph below is based on our data set which we created with Numpy, a python module, and has {p} parameters (p={p}) and {n} observations (n={n}). {dimension_note} Because the data is synthetic, we had the luxury of making our own true β’s which are located at {true_betas}. We set a signal to noise ratio of {snr:g} to create our X matrix, β Matrix, error matrix and finally our y equation at y = Xβ + ε.{slider_note}
 """
             ),
             html.P(
-                """
-Finally, using Sklearn, another python module, we split our synthetic data into a portion for training and a portion for testing and iteratively created 6 LASSO models at incremental alpha levels (0.0001, 0.001, 0.01, 0.1, 1, 10) to illustrate the model pushing β coefficients into and out of the model. Think of the alpha level as the “penalty” the model applies to each β coefficient. As the alpha level gets smaller, the β coefficients receive a small push towards zero, leaving most of the coefficients in the model. Conversely, as the alpha level grows larger, the β coefficients receive a large push towards zero which removes many of the coefficients entirely.
+                f"""
+Finally, using Sklearn, another python module, we split our synthetic data into a portion for training and a portion for testing and fitted {len(alphas)} LASSO models at incremental alpha levels ({levels}), solved as one warm-started path from the largest alpha down, to illustrate the model pushing β coefficients into and out of the model. Think of the alpha level as the “penalty” the model applies to each β coefficient. As the alpha level gets smaller, the β coefficients receive a small push towards zero, leaving most of the coefficients in the model. Conversely, as the alpha level grows larger, the β coefficients receive a large push towards zero which removes many of the coefficients entirely.
 """
             ),
             html.Div(
                 "Visualization of the relationship between α and number of predictors",
-                style=styles["title"],
+                style=STYLES["title"],
             ),
             html.Div(
                 "Move the alpha (α) slider to watch predictors add and drop from the model. True predictors are red.",
-                style=styles["subtitle"],
+                style=STYLES["subtitle"],
+            ),
+            html.Div(
+                style=STYLES["controls"] if refit else {"display": "none"},
+                children=[
+                    _refit_slider(
+                        "Observations (n)", {"type": f"{prefix}-n", "uid": uid}, n, _N_RANGE
+                    ),
+                    _refit_slider(
+                        "Predictors (p)", {"type": f"{prefix}-p", "uid": uid}, p, _P_RANGE
+                    ),
+                    _refit_slider(
+                        "Signal-to-noise ratio",
+                        {"type": f"{prefix}-snr", "uid": uid},
+                        snr,
+                        _SNR_RANGE,
+                    ),
+                ],
             ),
             dcc.Slider(
-                id={"type": "lasso-alpha", "uid": uid},
+                id={"type": f"{prefix}-alpha", "uid": uid},
                 min=0,
                 max=len(alphas) - 1,
-                step=None,
+                step=None if mark_every == 1 else 1,
                 value=len(alphas) // 2,
                 marks=marks,
                 tooltip={"always_visible": False},
             ),
-            html.Div(id={"type": "lasso-metrics", "uid": uid}, style=styles["metrics"]),
+            html.Div(id={"type": f"{prefix}-metrics", "uid": uid}, style=STYLES["metrics"]),
+            html.Div(
+                id={"type": f"{prefix}-equation", "uid": uid}, style=STYLES["equation"]
+            ),
             html.Div(
-                id={"type": "lasso-equation", "uid": uid}, style=styles["equation"]
+                "How well does each α predict data the model has not seen?",
+                style={**STYLES["title"], "marginTop": "1.5rem"},
             ),
+            html.Div(
+                f"Mean squared error on held-out folds ({_CV_FOLDS}-fold cross-validation "
+                "on the training split), with a ±1 standard error band. The dotted line "
+                "marks the α with the lowest error; the red dashed line marks the "
+                "one-standard-error choice, the simplest model whose error is "
+                "statistically indistinguishable from the best.",
+                style=STYLES["subtitle"],
+            ),
+            dcc.Graph(
+                id={"type": f"{prefix}-cv", "uid": uid},
+                figure=_cv_figure(n, p, alphas, snr, figure_digits),
+                config={"displayModeBar": False},
+            ),
+            *stores,
         ],
     )
 
-    # ---------------------------
-    # 6) Callback (scoped)
-    # ---------------------------
-    @app.callback(
-        Output({"type": "lasso-equation", "uid": MATCH}, "children"),
-        Output({"type": "lasso-metrics", "uid": MATCH}, "children"),
-        Input({"type": "lasso-alpha", "uid": MATCH}, "value"),
-        prevent_initial_call=False,
-    )
-    def _update(alpha_idx):
-        eq = _equation_children(alpha_idx)
-        selected = int(np.sum(coefs[alpha_idx] != 0.0))
-        r2 = r2s[alpha_idx]
-        a = alphas[alpha_idx]
-        metrics = f"α = {a:g} | selected predictors = {selected} | Test R² = {r2:.3f}"
-        return eq, metrics
-
     return container
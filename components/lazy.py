@@ -0,0 +1,112 @@
+"""Placeholders that build heavy demo components the first time they are needed."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional
+
+from dash import MATCH, ClientsideFunction, Input, Output, State, dcc, html, no_update
+
+from components.utils import register_once
+
+_BUILDERS: Dict[str, Callable[[], object]] = {}
+_BUILT: Dict[str, object] = {}
+# One lock per uid, so a slow build does not hold up the other demos; the
+# global lock only guards creating them.
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_LOCK = threading.Lock()
+
+_PLACEHOLDER_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "justifyContent": "center",
+    "color": "#6b7280",
+    "fontFamily": "system-ui, Arial, sans-serif",
+    "fontStyle": "italic",
+}
+
+
+def build_component(uid: str):
+    """Return the layout registered under ``uid``, building it once per process."""
+
+    built = _BUILT.get(uid)
+    if built is not None:
+        return built
+    with _LOCKS_LOCK:
+        lock = _LOCKS.setdefault(uid, threading.Lock())
+    with lock:
+        if uid not in _BUILT:
+            _BUILT[uid] = _BUILDERS[uid]()
+        return _BUILT[uid]
+
+
+def build_all() -> None:
+    """Build every registered demo now (e.g. in a server's master process before fork)."""
+
+    for uid in list(_BUILDERS):
+        build_component(uid)
+
+
+def _fill_slot(visible, slot_id):
+    uid = slot_id.get("uid") if isinstance(slot_id, dict) else None
+    # A stale page or a crafted id may name a slot this process never registered.
+    if not visible or not isinstance(uid, str) or uid not in _BUILDERS:
+        return no_update
+    return build_component(uid)
+
+
+def register_lazy_callbacks(app) -> None:
+    """Register the callbacks that detect visible slots and fill them in."""
+
+    if not register_once(app, "lazy"):
+        return
+
+    # Polls the slot's position in the browser; no server traffic until it is visible.
+    app.clientside_callback(
+        ClientsideFunction(namespace="lazy", function_name="whenVisible"),
+        Output({"type": "lazy-visible", "uid": MATCH}, "data"),
+        Output({"type": "lazy-poll", "uid": MATCH}, "disabled"),
+        Input({"type": "lazy-poll", "uid": MATCH}, "n_intervals"),
+        State({"type": "lazy-slot", "uid": MATCH}, "id"),
+    )
+
+    app.callback(
+        Output({"type": "lazy-slot", "uid": MATCH}, "children"),
+        Input({"type": "lazy-visible", "uid": MATCH}, "data"),
+        State({"type": "lazy-slot", "uid": MATCH}, "id"),
+        prevent_initial_call=True,
+    )(_fill_slot)
+
+
+def make_lazy_component(
+    app,
+    uid: str,
+    build: Callable[[], object],
+    *,
+    register: Optional[Callable[[object], None]] = None,
+    min_height: str = "480px",
+):
+    """Return a placeholder that renders ``build()`` once it scrolls into view.
+
+    ``register`` is called right away so the callbacks used by the built layout
+    are known to Dash before the first request; ``build`` itself runs at most
+    once per process and its result is shared by every later visitor.
+    """
+
+    register_lazy_callbacks(app)
+    if register is not None:
+        register(app)
+    _BUILDERS[uid] = build
+
+    return html.Div(
+        id={"type": "lazy-slot", "uid": uid},
+        style={"minHeight": min_height},
+        children=[
+            html.Div(
+                "Loading interactive demo…",
+                style={**_PLACEHOLDER_STYLE, "minHeight": min_height},
+            ),
+            dcc.Interval(id={"type": "lazy-poll", "uid": uid}, interval=300),
+            dcc.Store(id={"type": "lazy-visible", "uid": uid}, data=False),
+        ],
+    )
@@ -0,0 +1,74 @@
+"""Linear-algebra helpers shared by the regression demos."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DesignDiagnostics:
+    """Rank and conditioning facts about a design matrix X, from one SVD."""
+
+    singular_values: np.ndarray
+    rank: int
+    condition_number: float
+    determinant: float
+    # None for wide designs (p > n), which cannot have full column rank.
+    xtx_pinv: Optional[np.ndarray]
+    n_columns: int
+
+    @property
+    def is_full_rank(self) -> bool:
+        return self.rank == self.n_columns
+
+    @property
+    def xtx_inv(self):
+        """(XᵀX)⁻¹ when X has full column rank, otherwise None."""
+        return self.xtx_pinv if self.is_full_rank else None
+
+
+def diagnose_design(X: np.ndarray) -> DesignDiagnostics:
+    """Derive rank(X), cond(XᵀX), det(XᵀX) and (XᵀX)⁺ from a single SVD of X.
+
+    With X = U S Vᵀ we have XᵀX = V S² Vᵀ, so the cross-product never has to be
+    decomposed (or inverted) separately. The rank tolerance matches
+    ``np.linalg.matrix_rank``. When p > n only the singular values are
+    computed, which roughly halves the cost, and ``xtx_pinv`` is None.
+    """
+
+    n, p = X.shape
+    wide = p > n
+    if wide:
+        s, vt = np.linalg.svd(X, compute_uv=False), None
+    else:
+        _, s, vt = np.linalg.svd(X, full_matrices=False)
+    tol = s.max(initial=0.0) * max(n, p) * np.finfo(s.dtype).eps
+    rank = int(np.count_nonzero(s > tol))
+
+    # XᵀX has p eigenvalues; when n < p the missing ones are exactly zero.
+    if rank == p and s.size == p:
+        condition_number = float((s[0] / s[-1]) ** 2)
+        # Large designs overflow to inf, which is the honest float answer.
+        with np.errstate(over="ignore"):
+            determinant = float(np.prod(s**2))
+    else:
+        condition_number = np.inf
+        determinant = 0.0
+
+    xtx_pinv = None
+    if not wide:
+        inv_sq = np.zeros_like(s)
+        inv_sq[:rank] = 1.0 / s[:rank] ** 2
+        xtx_pinv = (vt.T * inv_sq) @ vt
+
+    return DesignDiagnostics(
+        singular_values=s,
+        rank=rank,
+        condition_number=condition_number,
+        determinant=determinant,
+        xtx_pinv=xtx_pinv,
+        n_columns=p,
+    )
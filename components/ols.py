@@ -0,0 +1,65 @@
+"""Batched ordinary least squares with an intercept, plus bootstrap refits.
+
+Both functions take the predictors without a column of ones and return the
+intercept first: coefficients have shape ``(..., k + 1)``. ``ols`` accepts a
+stack of designs and solves them all with one batched QR; ``bootstrap_ols``
+refits ``B`` row resamples of one design in a single stacked solve.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _with_intercept(X: np.ndarray) -> np.ndarray:
+    ones = np.ones(X.shape[:-1] + (1,), dtype=X.dtype)
+    return np.concatenate([ones, X], axis=-1)
+
+
+def ols(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Least-squares coefficients for ``X`` of shape ``(..., n, k)``, ``y`` ``(..., n)``.
+
+    Uses the reduced QR of ``[1, X]``: ``R β = Qᵀy``. NumPy factors every
+    design of a stack in one call.
+    """
+
+    Z = _with_intercept(np.asarray(X, dtype=float))
+    Q, R = np.linalg.qr(Z)
+    qty = np.einsum("...nk,...n->...k", Q, np.asarray(y, dtype=float))
+    return np.linalg.solve(R, qty[..., None])[..., 0]
+
+
+def bootstrap_counts(n: int, n_boot: int, rng: np.random.Generator) -> np.ndarray:
+    """How often each of ``n`` rows appears in each of ``n_boot`` resamples."""
+
+    rows = rng.integers(0, n, size=(n_boot, n))
+    rows += np.arange(n_boot)[:, None] * n  # one bincount for every resample
+    return np.bincount(rows.ravel(), minlength=n_boot * n).reshape(n_boot, n)
+
+
+def bootstrap_ols(X: np.ndarray, y: np.ndarray, n_boot: int, *, seed: int = 0) -> np.ndarray:
+    """Coefficients of ``n_boot`` case-resampling bootstrap refits, ``(n_boot, k + 1)``.
+
+    A resample that draws row ``i`` ``cᵢ`` times solves
+    ``Zᵀ diag(c) Z β = Zᵀ diag(c) y`` with ``Z = [1, X]``. So every replicate's
+    normal equations come from one ``(B, n) @ (n, (k+1)²)`` product, and one
+    batched ``solve`` handles them all. The ``B`` resampled designs are never
+    built. Predictors are centered first, which keeps these small systems well
+    conditioned.
+    """
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n, k = X.shape
+    x_mean, y_mean = X.mean(axis=0), y.mean()
+    Z = _with_intercept(X - x_mean)
+    yc = y - y_mean
+
+    counts = bootstrap_counts(n, n_boot, np.random.default_rng(seed)).astype(float)
+    gram = (counts @ (Z[:, :, None] * Z[:, None, :]).reshape(n, -1)).reshape(n_boot, k + 1, k + 1)
+    moment = counts @ (Z * yc[:, None])
+    beta = np.linalg.solve(gram, moment[..., None])[..., 0]
+
+    # Back to the uncentered parametrization.
+    beta[:, 0] += y_mean - beta[:, 1:] @ x_mean
+    return beta
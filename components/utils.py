@@ -1,9 +1,25 @@
 """Utility helpers shared between Dash components."""
 
 from pathlib import Path
+from typing import Set
+from weakref import WeakKeyDictionary
+
+_REGISTERED: "WeakKeyDictionary[object, Set[str]]" = WeakKeyDictionary()
 
 
 def load_markdown(path: Path) -> str:
     """Read markdown content from disk."""
     return path.read_text(encoding="utf-8")
 
+
+def register_once(app, key: str) -> bool:
+    """Return True the first time ``key`` is seen for ``app``, False afterwards.
+
+    Components register their pattern-matching callbacks once per app so the
+    layout can be built (or rebuilt lazily) any number of times.
+    """
+    seen = _REGISTERED.setdefault(app, set())
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
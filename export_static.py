@@ -0,0 +1,107 @@
+"""Export the article as a static bundle that needs no Python server.
+
+The Dash renderer still runs in the browser, but the layout and the
+(clientside-only) callback graph are embedded in ``index.html`` and every
+script it loads is copied next to it, so any static file host can serve the
+result. Demos that need server callbacks are replaced by a short note.
+
+Usage:
+    python export_static.py --out dist
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+from pathlib import Path
+
+# Requests for these endpoints are answered from the embedded JSON.
+_FETCH_SHIM = """<script>
+(function () {
+    var data = JSON.parse(document.getElementById("_static-dash-data").textContent);
+    var realFetch = window.fetch.bind(window);
+    window.fetch = function (input, init) {
+        var url = typeof input === "string" ? input : input.url;
+        var path = url.split("?")[0];
+        for (var endpoint in data) {
+            if (path.slice(-endpoint.length) === endpoint) {
+                return Promise.resolve(new Response(JSON.stringify(data[endpoint]), {
+                    status: 200,
+                    headers: {"Content-Type": "application/json"},
+                }));
+            }
+        }
+        return realFetch(input, init);
+    };
+})();
+</script>"""
+
+
+def _write(out_dir: Path, url: str, content: bytes) -> None:
+    target = out_dir / url.split("?")[0].lstrip("/")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(content)
+
+
+def export(out_dir: Path) -> Path:
+    """Write the static bundle into ``out_dir`` and return the index path."""
+
+    import main
+
+    app = main.app
+    app.layout = main.build_layout(lazy=False, static=True)
+    client = app.server.test_client()
+
+    index = client.get("/").get_data(as_text=True)
+    layout = json.loads(client.get("/_dash-layout").get_data())
+    # Only clientside callbacks can run without a server.
+    dependencies = [
+        cb
+        for cb in json.loads(client.get("/_dash-dependencies").get_data())
+        if cb.get("clientside_function")
+    ]
+
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+
+    # Scripts, styles and assets referenced by the index page ...
+    urls = set(re.findall(r'(?:src|href)="(/[^"]+)"', index))
+    # ... plus the chunks the component suites load on demand (graphs, markdown, ...).
+    for package, paths in app.registered_paths.items():
+        urls.update(
+            f"/_dash-component-suites/{package}/{path}"
+            for path in paths
+            if not path.endswith(".map")
+        )
+    for url in sorted(urls):
+        response = client.get(url)
+        if response.status_code == 200:
+            _write(out_dir, url, response.get_data())
+
+    embedded = json.dumps(
+        {"_dash-layout": layout, "_dash-dependencies": dependencies}
+    ).replace("</", "<\\/")
+    index = index.replace(
+        "<head>",
+        '<head>\n<script type="application/json" id="_static-dash-data">'
+        f"{embedded}</script>\n{_FETCH_SHIM}",
+        1,
+    )
+    index_path = out_dir / "index.html"
+    index_path.write_text(index, encoding="utf-8")
+    return index_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path("dist"), help="output directory")
+    args = parser.parse_args()
+    index_path = export(args.out)
+    print(f"Wrote {index_path}")
+
+
+if __name__ == "__main__":
+    main()
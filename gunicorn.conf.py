@@ -0,0 +1,27 @@
+"""Gunicorn settings: load the app once in the master process, then fork.
+
+    gunicorn -c gunicorn.conf.py
+
+The master imports ``main`` and builds every demo before forking (see
+``main.prewarm``), so the precomputed arrays are memory-mapped from the artifact
+cache and the built layouts are shared copy-on-write: resident memory no longer
+grows with one full copy per worker. Set HIGHDIM_PREWARM=0 to skip the warm-up
+and build lazily in each worker instead.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "main:server"
+bind = os.environ.get("HIGHDIM_BIND", "0.0.0.0:8050")
+workers = int(os.environ.get("WEB_CONCURRENCY", min(4, multiprocessing.cpu_count())))
+preload_app = True
+
+
+def when_ready(server):
+    if os.environ.get("HIGHDIM_PREWARM", "1") != "1":
+        return
+    import main
+
+    main.prewarm()
+    server.log.info("Prewarmed demos before forking workers")
@@ -1,16 +1,78 @@
+import gc
+import importlib.util
+import os
 from pathlib import Path
 
 import dash
-from dash import Input, Output, dcc, html
+from dash import Input, Output, State, dcc, html, no_update
+from dash.exceptions import PreventUpdate
 
-from components.coef_paths import make_lasso_path_component
-from components.econ_demo import make_econ_component
-from components.full_rank_component import make_full_rank_component
-from components.lasso_component import make_lasso_component
+from components.coef_paths import (
+    make_lasso_path_component,
+    register_lasso_path_callbacks,
+    wait_for_path_jobs,
+)
+from components.background import make_background_manager
+from components.cv import shutdown_pool
+from components.double_descent import make_double_descent_component
+from components.econ_demo import (
+    econ_cache_info,
+    make_econ_component,
+    register_econ_callbacks,
+)
+from components.full_rank_component import (
+    large_render_cache_info,
+    make_full_rank_component,
+    register_full_rank_callbacks,
+    render_cache_info,
+)
+from components.hot_reload import MarkdownWatcher
+from components.http_cache import serve_snapshots
+from components.instrumentation import instrument
+from components.lasso_component import (
+    cv_cache_info,
+    equation_cache_info,
+    fit_cache_info,
+    make_lasso_component,
+    register_lasso_callbacks,
+)
+from components.lazy import build_all, make_lazy_component
 from components.table_of_contents import make_table_of_contents
 from theme import COLORS
 
-app = dash.Dash(__name__)
+# Responses are gzip/brotli-compressed when flask-compress is installed
+# (pip install "dash[compress]"); HIGHDIM_COMPRESS=0 turns it off.
+COMPRESS = (
+    os.environ.get("HIGHDIM_COMPRESS", "1") == "1"
+    and importlib.util.find_spec("flask_compress") is not None
+)
+# Figure arrays are sent as float32 rounded to this many significant digits.
+FIGURE_DIGITS = 4
+
+# Demo layouts are inserted lazily, so their IDs are not in the initial layout.
+# Expensive callbacks run in background processes when diskcache is installed.
+app = dash.Dash(
+    __name__,
+    suppress_callback_exceptions=True,
+    background_callback_manager=make_background_manager(),
+    compress=COMPRESS,
+)
+server = app.server  # WSGI entry point, e.g. ``gunicorn -c gunicorn.conf.py``
+
+# Must run before any callback is registered; serves /metrics.
+metrics = instrument(
+    app, server_timing=os.environ.get("HIGHDIM_SERVER_TIMING", "1") == "1"
+)
+metrics.register_cache("full_rank_render", render_cache_info)
+metrics.register_cache("full_rank_render_large", large_render_cache_info)
+metrics.register_cache("lasso_fit", fit_cache_info)
+metrics.register_cache("lasso_equation", equation_cache_info)
+metrics.register_cache("lasso_cv", cv_cache_info)
+metrics.register_cache("econ", econ_cache_info)
+
+# The layout and callback list are the same for every visitor: serialize them
+# once and let browsers and proxies revalidate with ETags (304s).
+clear_snapshots = serve_snapshots(app)
 
 NOTES_DIR = Path("notes")
 
@@ -25,8 +87,18 @@ _SECTION_FILES = [
     "contributors.md",
 ]
 
+# Markdown hot reload is a development aid: on when this file is run directly,
+# off under a production server (gunicorn imports it as ``main``) unless
+# HIGHDIM_HOT_RELOAD=1 is set.
+HOT_RELOAD = (
+    os.environ.get("HIGHDIM_HOT_RELOAD", "1" if __name__ == "__main__" else "0") == "1"
+)
+_watcher = MarkdownWatcher(NOTES_DIR, _SECTION_FILES).start() if HOT_RELOAD else None
+
 
 def read_md(filename: str) -> str:
+    if _watcher is not None:
+        return _watcher.text(filename)
     return (NOTES_DIR / filename).read_text(encoding="utf-8")
 
 
@@ -50,61 +122,187 @@ PAGE_STYLE = {
 }
 
 
-app.layout = html.Div(
-    style=PAGE_STYLE,
-    children=[
-        html.H1(
-            "When Predictors Outnumber Data: Making Sense of High-Dimensional Regression",
-            style={"textAlign": "center"},
-        ),
-        html.P(
-            [
-                "Source code available on ",
-                html.A(
-                    "GitHub",
-                    href="https://github.com/tomtranjr/msds601-highdim-group9",
-                    target="_blank",
-                    rel="noopener noreferrer",
+def _demo(uid, build, *, lazy, register=None, min_height="480px"):
+    if not lazy:
+        return build()
+    return make_lazy_component(
+        app, uid, build, register=register, min_height=min_height
+    )
+
+
+def _live_only_note(title: str) -> html.Div:
+    return html.Div(
+        [
+            html.Strong(title),
+            html.Div(
+                "This demo recomputes on the server, so it is only available in the "
+                "live app. Run main.py locally to explore it."
+            ),
+        ],
+        style={
+            "margin": "1.5rem auto",
+            "padding": "0.75rem 1rem",
+            "borderRadius": "8px",
+            "backgroundColor": "#f5f7fb",
+            "color": "#4b5563",
+        },
+    )
+
+
+def build_layout(*, lazy: bool = True, static: bool = False) -> html.Div:
+    """Assemble the page.
+
+    ``lazy=False`` builds every demo up front; ``static=True`` additionally drops
+    the pieces that need server callbacks (used by export_static.py).
+    """
+
+    if static:
+        full_rank = _live_only_note(
+            "Why Full Column Rank Keeps Ordinary Least Squares on Solid Ground"
+        )
+    else:
+        full_rank = _demo(
+            "fullrank-demo",
+            lambda: make_full_rank_component(app, uid="fullrank-demo"),
+            lazy=lazy,
+            register=register_full_rank_callbacks,
+        )
+    hot_reload = HOT_RELOAD and not static
+
+    return html.Div(
+        style=PAGE_STYLE,
+        children=[
+            html.H1(
+                "When Predictors Outnumber Data: Making Sense of High-Dimensional Regression",
+                style={"textAlign": "center"},
+            ),
+            html.P(
+                [
+                    "Source code available on ",
+                    html.A(
+                        "GitHub",
+                        href="https://github.com/tomtranjr/msds601-highdim-group9",
+                        target="_blank",
+                        rel="noopener noreferrer",
+                    ),
+                    ".",
+                ],
+                style={"textAlign": "center", "marginTop": "12px"},
+            ),
+            html.Hr(),
+            # introduction
+            make_table_of_contents(),
+            render_section("00_intro.md"),
+            render_section("01_startMLR.md"),
+            render_section("02_highdim_setting.md"),
+            render_section("03_ols_breakdown.md"),
+            full_rank,
+            _demo(
+                "double-descent-demo",
+                lambda: make_double_descent_component(
+                    app, uid="double-descent-demo", figure_digits=FIGURE_DIGITS
                 ),
-                ".",
-            ],
-            style={"textAlign": "center", "marginTop": "12px"},
-        ),
-        html.Hr(),
-        # introduction
-        make_table_of_contents(),
-        render_section("00_intro.md"),
-        render_section("01_startMLR.md"),
-        render_section("02_highdim_setting.md"),
-        render_section("03_ols_breakdown.md"),
-        make_full_rank_component(app, uid="fullrank-demo"),
-        render_section("04_regularization_dimred.md"),
-        make_econ_component(app, uid="econ-demo"),
-        make_lasso_component(app, uid="lasso-demo"),
-        render_section("05_why_matters.md"),
-        make_lasso_path_component(
-            app,
-            uid="lasso-demo",
-            n=40,
-            p=120,
-            seed=0,
-            target_signal_noise_ratio=5.0,
-        ),
-        render_section("references.md"),
-        # interactive_layout,
-        # another_plot,
-        render_section("contributors.md"),
-        # dcc.Interval(id="refresh", interval=2000),
-    ],
-)
+                lazy=lazy,
+            ),
+            render_section("04_regularization_dimred.md"),
+            _demo(
+                "econ-demo",
+                lambda: make_econ_component(
+                    app,
+                    uid="econ-demo",
+                    interactive=not static,
+                    figure_digits=FIGURE_DIGITS,
+                ),
+                lazy=lazy,
+                register=None if static else register_econ_callbacks,
+            ),
+            _demo(
+                "lasso-demo",
+                lambda: make_lasso_component(
+                    app,
+                    uid="lasso-demo",
+                    clientside=True,
+                    refit=not static,
+                    figure_digits=FIGURE_DIGITS,
+                ),
+                lazy=lazy,
+                register=register_lasso_callbacks,
+            ),
+            render_section("05_why_matters.md"),
+            _demo(
+                "lasso-path-demo",
+                lambda: make_lasso_path_component(
+                    app,
+                    uid="lasso-demo",
+                    n=40,
+                    p=120,
+                    seed=0,
+                    target_signal_noise_ratio=5.0,
+                    render="webgl",
+                    progressive=not static,
+                    figure_digits=FIGURE_DIGITS,
+                ),
+                lazy=lazy,
+                register=None if static else register_lasso_path_callbacks,
+                min_height="650px",
+            ),
+            render_section("references.md"),
+            # interactive_layout,
+            # another_plot,
+            render_section("contributors.md"),
+            *(
+                [
+                    dcc.Interval(id="refresh", interval=2000),
+                    dcc.Store(id="md-versions", data=_watcher.versions()),
+                ]
+                if hot_reload
+                else []
+            ),
+        ],
+    )
 
 
-@app.callback(
-    [Output(f"md-{Path(filename).stem}", "children") for filename in _SECTION_FILES],
-    Input("refresh", "n_intervals"),
-)
-def update_markdown(_):
-    return [read_md(filename) for filename in _SECTION_FILES]
+app.layout = build_layout()
+
+
+def prewarm() -> None:
+    """Build every demo and the layout snapshots; gunicorn.conf.py calls this before forking.
+
+    Precomputed arrays land in the artifact cache and are memory-mapped
+    read-only, and layouts built here are inherited copy-on-write, so workers
+    share one copy instead of each building their own. ``gc.freeze()`` keeps
+    the collector from writing to (and so copying) those pages in the workers.
+    """
+
+    build_all()
+    # Threads do not survive fork; let background path solves finish first,
+    # and stop the process pool used while building (workers solve in-process).
+    wait_for_path_jobs()
+    shutdown_pool()
+    client = server.test_client()
+    for endpoint in ("_dash-layout", "_dash-dependencies"):
+        client.get(app.config.routes_pathname_prefix + endpoint)
+    gc.collect()
+    gc.freeze()
+
+
+def update_markdown(_, known_versions):
+    # Only sections whose files changed since this client last synced are sent.
+    changed = _watcher.changed_since(known_versions or {})
+    if not changed:
+        raise PreventUpdate
+    sections = [changed.get(filename, no_update) for filename in _SECTION_FILES]
+    return sections + [_watcher.versions()]
+
+
+if HOT_RELOAD:
+    app.callback(
+        [Output(f"md-{Path(filename).stem}", "children") for filename in _SECTION_FILES]
+        + [Output("md-versions", "data")],
+        Input("refresh", "n_intervals"),
+        State("md-versions", "data"),
+        prevent_initial_call=True,
+    )(update_markdown)
 
 
 if __name__ == "__main__":
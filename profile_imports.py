@@ -0,0 +1,117 @@
+"""Report how long importing each component (and main.py) takes.
+
+Every module is imported in a fresh interpreter with ``python -X importtime``,
+so each figure is a cold import including everything it pulls in. Alongside
+the total, the heaviest third-party packages each module loads are listed;
+those are the imports to defer into the function that needs them.
+
+Usage:
+    python profile_imports.py                      # main + every component
+    python profile_imports.py components.lasso_component --top 10
+    python profile_imports.py --out import_times.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+ROOT = Path(__file__).resolve().parent
+
+
+class _Entry(NamedTuple):
+    self_us: int
+    cumulative_us: int
+    depth: int
+    name: str
+
+
+def _parse(stderr: str) -> List[_Entry]:
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append(_Entry(int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def _default_modules() -> List[str]:
+    components = sorted(
+        f"components.{path.stem}"
+        for path in (ROOT / "components").glob("*.py")
+        if path.stem != "__init__"
+    )
+    return ["main", *components]
+
+
+def profile(module: str, top: int) -> Dict[str, object]:
+    """Cold-import ``module`` in a subprocess and summarize ``-X importtime``."""
+
+    env = {**os.environ, "HIGHDIM_HOT_RELOAD": "0"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = _parse(proc.stderr)
+    end = next(i for i, e in enumerate(entries) if e.name == module and e.depth == 0)
+    target = entries[end]
+    # Children are printed before their parent; interpreter startup comes first.
+    start = end
+    while start > 0 and entries[start - 1].depth > 0:
+        start -= 1
+    loaded = entries[start:end]
+
+    # Where each top-level package was first imported, with everything it pulled in.
+    packages: Dict[str, int] = {}
+    for entry in loaded:
+        root = entry.name.split(".", 1)[0]
+        if root in ("components", module) or root.startswith("_"):
+            continue
+        packages[root] = max(packages.get(root, 0), entry.cumulative_us)
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "total_ms": target.cumulative_us / 1e3,
+        "self_ms": target.self_us / 1e3,
+        "modules_loaded": len(loaded),
+        "heaviest": [{"package": name, "ms": us / 1e3} for name, us in heaviest],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="default: main and every component")
+    parser.add_argument("--top", type=int, default=5, help="heaviest packages to list")
+    parser.add_argument("--out", type=Path, default=None, help="also write JSON here")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules or _default_modules():
+        result = profile(module, args.top)
+        results.append(result)
+        heaviest = ", ".join(f"{h['package']} {h['ms']:.0f}" for h in result["heaviest"])
+        print(
+            f"{module:36s} {result['total_ms']:8.1f} ms  "
+            f"{result['modules_loaded']:5d} modules  [{heaviest}]"
+        )
+
+    if args.out is not None:
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Wrote {len(results)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()